@@ -1,27 +1,118 @@
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+ANOMALY_PATTERNS = [
+    r'failed login',
+    r'error',
+    r'unauthorized access',
+    r'exception',
+    r'critical'
+]
+# Matched against raw bytes so lines that don't match are never decoded.
+ANOMALY_RE = re.compile('|'.join(ANOMALY_PATTERNS).encode('ascii'), re.IGNORECASE)
+CHUNK_SIZE = 64 * 1024 * 1024
+
+def _build_hyperscan_db():
+    # The patterns are plain keywords, so a caseless DFA scan reports the same matches as ANOMALY_RE.
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode('ascii') for pattern in ANOMALY_PATTERNS],
+        ids=list(range(len(ANOMALY_PATTERNS))),
+        elements=len(ANOMALY_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(ANOMALY_PATTERNS),
+    )
+    return database
+
+HYPERSCAN_DB = _build_hyperscan_db() if HYPERSCAN_AVAILABLE else None
 
 def detect_anomalies(log_file):
-    with open(log_file, 'r') as file:
-        logs = file.readlines()
-    
-    anomaly_patterns = [
-        r'failed login',
-        r'error',
-        r'unauthorized access',
-        r'exception',
-        r'critical'
-    ]
-    
     anomalies = []
-    for line in logs:
-        if any(re.search(pattern, line, re.IGNORECASE) for pattern in anomaly_patterns):
-            anomalies.append(line.strip())
-    
+    with open(log_file, 'rb') as file:
+        for line in file:
+            if ANOMALY_RE.search(line):
+                anomalies.append(line.decode('utf-8', 'replace').strip())
+
+    return anomalies
+
+def detect_anomalies_parallel(log_file, chunk_size=CHUNK_SIZE, max_workers=None):
+    # Small files aren't worth the process start-up cost.
+    if os.path.getsize(log_file) <= chunk_size:
+        return detect_anomalies(log_file)
+
+    tasks = [(log_file, start, end) for start, end in _chunk_bounds(log_file, chunk_size)]
+    anomalies = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # map() yields results in chunk order, so file order is preserved.
+        for chunk_anomalies in executor.map(_scan_chunk, tasks):
+            anomalies.extend(chunk_anomalies)
+    return anomalies
+
+def _chunk_bounds(log_file, chunk_size):
+    size = os.path.getsize(log_file)
+    bounds = []
+    with open(log_file, 'rb') as file:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                # Extend to the end of the current line so no line is split across chunks.
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+def _scan_chunk(task):
+    log_file, start, end = task
+    # Scan the mapping in place: slicing it would copy the whole chunk into a bytes object.
+    with open(log_file, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if HYPERSCAN_DB is not None:
+                match_ends = []
+
+                def on_match(pattern_id, match_from, match_to, flags, context):
+                    match_ends.append(start + match_to)
+
+                # A memoryview slice hands Hyperscan the mapped pages without copying them; both views
+                # are released before the mapping closes.
+                with memoryview(mapped) as view, view[start:end] as chunk_view:
+                    HYPERSCAN_DB.scan(chunk_view, match_event_handler=on_match)
+            else:
+                match_ends = [match.end() for match in ANOMALY_RE.finditer(mapped, start, end)]
+            return _matched_lines(mapped, match_ends, start, end)
+
+def _matched_lines(buffer, match_ends, start, end):
+    # match_ends must be ascending offsets into buffer; several matches on one line yield that line once.
+    # Searches stay within [start, end), so only the matched lines are copied out.
+    anomalies = []
+    last_line_end = -1
+    for match_end in match_ends:
+        if match_end <= last_line_end:
+            continue
+        newline = buffer.rfind(b'\n', start, match_end)
+        line_start = start if newline == -1 else newline + 1
+        line_end = buffer.find(b'\n', match_end, end)
+        if line_end == -1:
+            line_end = end
+        anomalies.append(buffer[line_start:line_end].decode('utf-8', 'replace').strip())
+        last_line_end = line_end
     return anomalies
 
-# Example usage
-log_file = "system_logs.txt"
-anomalies = detect_anomalies(log_file)
-print("Detected Anomalies:")
-for anomaly in anomalies:
-    print(anomaly)
+if __name__ == '__main__':
+    # Example usage
+    log_file = "system_logs.txt"
+    anomalies = detect_anomalies_parallel(log_file)
+    print("Detected Anomalies:")
+    for anomaly in anomalies:
+        print(anomaly)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from propupkeep.core.logging_utils import get_logger
+
+
+class DiskResponseCache:
+    """Content-addressed cache of raw model output, one small JSON file per key."""
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int) -> None:
+        self._cache_dir = cache_dir
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._logger = get_logger(__name__)
+        self._prune_expired()
+
+    @staticmethod
+    def build_key(model: str, messages: list[dict[str, str]]) -> str:
+        # Submissions that differ only in spacing or line breaks share an entry.
+        normalized = [{**message, "content": " ".join(message["content"].split())} for message in messages]
+        material = json.dumps({"model": model, "messages": normalized}, sort_keys=True, ensure_ascii=True)
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        entry_path = self._entry_path(key)
+        try:
+            with entry_path.open("r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            self._discard(entry_path)
+            return None
+
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) < time.time():
+            self._discard(entry_path)
+            return None
+        content = entry.get("content")
+        return content if isinstance(content, str) else None
+
+    def set(self, key: str, content: str) -> None:
+        entry_path = self._entry_path(key)
+        entry = {"expires_at": time.time() + self._ttl_seconds, "content": content}
+        temp_path: Path | None = None
+        try:
+            # A unique temp file per writer, so concurrent sets of one key never share a partial file.
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self._cache_dir,
+                prefix=f"{key}.",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temp_path = Path(handle.name)
+                json.dump(entry, handle, ensure_ascii=True)
+            os.replace(temp_path, entry_path)
+        except OSError as exc:
+            if temp_path is not None:
+                self._discard(temp_path)
+            self._logger.warning(
+                "Unable to write AI response cache entry",
+                extra={"context": {"error": str(exc)}},
+            )
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _prune_expired(self) -> None:
+        # Entries are written with expires_at = mtime + ttl, so mtime alone finds the expired ones without
+        # parsing them. Also sweeps temp files left behind by a crashed writer.
+        cutoff = time.time() - self._ttl_seconds
+        try:
+            paths = [*self._cache_dir.glob("*.json"), *self._cache_dir.glob("*.tmp")]
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
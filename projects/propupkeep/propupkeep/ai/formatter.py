@@ -1,23 +1,199 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 import re
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
 
-from pydantic import ValidationError
+import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
-from propupkeep.ai.prompts import JSON_OUTPUT_INSTRUCTIONS, TEAM_BRIEF_SYSTEM_PROMPT
+from propupkeep.ai.cache import DiskResponseCache
+from propupkeep.ai.prompts import (
+    JSON_OUTPUT_INSTRUCTIONS,
+    PACKED_JSON_OUTPUT_INSTRUCTIONS,
+    TEAM_BRIEF_SYSTEM_PROMPT,
+)
 from propupkeep.config.settings import Settings
 from propupkeep.core.errors import AIFormattingError, ConfigurationError
 from propupkeep.core.logging_utils import get_logger
 from propupkeep.models.issue import AIFormattedIssue, IssueMetadata, IssueSource
 
 
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504, 529})
+FENCE_OPEN_PATTERN = re.compile(r"^```(?:json)?\s*")
+FENCE_CLOSE_PATTERN = re.compile(r"\s*```$")
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+AI_FORMATTED_ISSUE_ADAPTER = TypeAdapter(AIFormattedIssue)
+
+# Shared, never mutated: every request reuses the same system message objects.
+FORMAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": f"{TEAM_BRIEF_SYSTEM_PROMPT}\n\n{JSON_OUTPUT_INSTRUCTIONS}",
+}
+PACKED_FORMAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": f"{TEAM_BRIEF_SYSTEM_PROMPT}\n\n{PACKED_JSON_OUTPUT_INSTRUCTIONS}",
+}
+REPAIR_SYSTEM_MESSAGE = {"role": "system", "content": TEAM_BRIEF_SYSTEM_PROMPT}
+
+# Out-of-vocabulary labels the model commonly emits, mapped locally to avoid a repair round-trip.
+URGENCY_SYNONYMS = {
+    "urgent": "High",
+    "critical": "High",
+    "emergency": "High",
+    "severe": "High",
+    "moderate": "Medium",
+    "normal": "Medium",
+    "minor": "Low",
+    "routine": "Low",
+    "n/a": "Unknown",
+    "none": "Unknown",
+}
+CATEGORY_SYNONYMS = {
+    "cosmetic/minor": "Cosmetic",
+    "minor": "Cosmetic",
+    "heating": "HVAC",
+    "cooling": "HVAC",
+    "air conditioning": "HVAC",
+    "hvac/mechanical": "HVAC",
+    "leak": "Plumbing",
+    "water": "Plumbing",
+    "electric": "Electrical",
+    "power": "Electrical",
+    "appliances": "Appliance",
+    "fire": "Safety",
+    "security": "Safety",
+    "maintenance": "General",
+    "other": "General",
+}
+
+
+class _CircuitBreaker:
+    """Fast-fails calls after repeated service failures until a cooldown elapses."""
+
+    def __init__(self, fail_threshold: int, recovery_seconds: float) -> None:
+        self._fail_threshold = max(1, fail_threshold)
+        self._recovery_seconds = recovery_seconds
+        self._state = "closed"
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == "closed":
+                return
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self._recovery_seconds:
+                    raise self._open_error()
+                self._transition("half_open")
+            if self._probe_in_flight:
+                raise self._open_error()
+            self._probe_in_flight = True
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._failure_count = 0
+            self._probe_in_flight = False
+            if self._state != "closed":
+                self._transition("closed")
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self._failure_count += 1
+            if self._state == "half_open" or self._failure_count >= self._fail_threshold:
+                self._opened_at = time.monotonic()
+                if self._state != "open":
+                    self._transition("open")
+
+    def _transition(self, new_state: str) -> None:
+        self._logger.warning(
+            "AI circuit breaker state changed",
+            extra={
+                "context": {
+                    "from_state": self._state,
+                    "to_state": new_state,
+                    "failure_count": self._failure_count,
+                }
+            },
+        )
+        self._state = new_state
+
+    @staticmethod
+    def _open_error() -> AIFormattingError:
+        return AIFormattingError(
+            "AI service is temporarily unavailable. Please try again shortly.",
+            detail="Circuit breaker open; skipping AI service call.",
+        )
+
+
 class OpenAIIssueFormatter:
+    _connect_timeout_seconds = 10.0
+    _max_keepalive_connections = 20
+    _max_connections = 50
+    _max_packed_submissions = 8
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._logger = get_logger(__name__)
+        # One pooled client per formatter so keep-alive amortizes the TLS handshake across calls.
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(
+                settings.request_timeout_seconds,
+                connect=self._connect_timeout_seconds,
+            ),
+            limits=httpx.Limits(
+                max_keepalive_connections=self._max_keepalive_connections,
+                max_connections=self._max_connections,
+            ),
+        )
+        self._base_payload = {
+            "model": settings.openai_model,
+            "temperature": 0.2,
+            "response_format": {"type": "json_object"},
+            "stream": True,
+        }
+        self._breaker = _CircuitBreaker(
+            fail_threshold=settings.breaker_fail_threshold,
+            recovery_seconds=settings.breaker_recovery_seconds,
+        )
+        self._cache = (
+            DiskResponseCache(settings.ai_cache_dir, ttl_seconds=settings.ai_cache_ttl_seconds)
+            if settings.enable_ai_cache
+            else None
+        )
+        # Futures for formats currently running, keyed like the response cache.
+        self._in_flight: dict[str, Future[AIFormattedIssue]] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def close(self) -> None:
+        self._http.close()
+
+    def warm_up(self) -> None:
+        """Open a pooled connection in the background so the first submission skips DNS + TLS setup."""
+        if not self._settings.openai_api_key:
+            return
+        threading.Thread(target=self._warm_connection, name="openai-warmup", daemon=True).start()
+
+    def _warm_connection(self) -> None:
+        # Any response (even 404/405) leaves a keep-alive connection in the pool.
+        try:
+            self._http.head(self._settings.openai_chat_url, timeout=5.0)
+        except httpx.HTTPError as exc:
+            self._logger.info(
+                "AI connection warmup failed",
+                extra={"context": {"error": str(exc)}},
+            )
 
     def format_issue(
         self,
@@ -25,7 +201,7 @@ class OpenAIIssueFormatter:
         metadata: IssueMetadata,
         note_text: str | None,
         image_filename: str | None = None,
-        image_bytes: bytes | None = None,
+        image_size: int = 0,
         image_mime: str | None = None,
     ) -> AIFormattedIssue:
         if not self._settings.openai_api_key:
@@ -38,17 +214,89 @@ class OpenAIIssueFormatter:
             metadata=metadata,
             note_text=note_text,
             image_filename=image_filename,
-            image_bytes=image_bytes,
+            image_size=image_size,
             image_mime=image_mime,
         )
         messages = [
-            {"role": "system", "content": f"{TEAM_BRIEF_SYSTEM_PROMPT}\n\n{JSON_OUTPUT_INSTRUCTIONS}"},
+            FORMAT_SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt},
         ]
 
-        initial_content = self._chat_completion(messages)
+        cache_key = DiskResponseCache.build_key(self._settings.openai_model, messages)
+        cached = self._cached_format(cache_key)
+        if cached is not None:
+            return cached
+
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(cache_key)
+            if in_flight is None:
+                owned: Future[AIFormattedIssue] = Future()
+                self._in_flight[cache_key] = owned
+        if in_flight is not None:
+            # The same submission is already being formatted, e.g. prefetched while it was typed.
+            return in_flight.result()
+
+        try:
+            # A run that finished since the lookup above has already cached its result.
+            formatted = self._cached_format(cache_key)
+            if formatted is None:
+                formatted = self._format_uncached(
+                    messages,
+                    cache_key,
+                    source=source,
+                    metadata=metadata,
+                    note_text=note_text,
+                    image_filename=image_filename,
+                    image_size=image_size,
+                    image_mime=image_mime,
+                )
+        except BaseException as exc:
+            owned.set_exception(exc)
+            raise
+        else:
+            owned.set_result(formatted)
+            return formatted
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[cache_key]
+
+    def prefetch_issue(self, **kwargs: Any) -> None:
+        """Start formatting a submission in the background; a matching format_issue call reuses the result.
+
+        Only runs when the response cache is on, since that is where a finished prefetch is kept.
+        """
+        if not self._settings.enable_ai_prefetch or not self._settings.openai_api_key or self._cache is None:
+            return
+        threading.Thread(
+            target=self._run_prefetch,
+            kwargs=kwargs,
+            name="openai-prefetch",
+            daemon=True,
+        ).start()
+
+    def _run_prefetch(self, **kwargs: Any) -> None:
+        try:
+            self.format_issue(**kwargs)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.info(
+                "AI prefetch failed",
+                extra={"context": {"error": str(exc)}},
+            )
+
+    def _format_uncached(
+        self,
+        messages: list[dict[str, str]],
+        cache_key: str,
+        source: IssueSource,
+        metadata: IssueMetadata,
+        note_text: str | None,
+        image_filename: str | None,
+        image_size: int,
+        image_mime: str | None,
+    ) -> AIFormattedIssue:
+        initial_content = self._call_model(messages)
         try:
-            return self._parse_and_validate(initial_content)
+            formatted = self._parse_and_validate(initial_content)
         except (ValidationError, ValueError, json.JSONDecodeError) as first_error:
             self._logger.warning(
                 "Initial AI response invalid; attempting single repair retry",
@@ -62,11 +310,11 @@ class OpenAIIssueFormatter:
                 metadata=metadata,
                 note_text=note_text,
                 image_filename=image_filename,
-                image_bytes=image_bytes,
+                image_size=image_size,
                 image_mime=image_mime,
             )
             try:
-                return self._parse_and_validate(repaired_content)
+                formatted = self._parse_and_validate(repaired_content)
             except (ValidationError, ValueError, json.JSONDecodeError) as second_error:
                 self._logger.error(
                     "AI response invalid after repair retry",
@@ -76,6 +324,137 @@ class OpenAIIssueFormatter:
                     "We could not format this note right now. Please edit and try again.",
                     detail=str(second_error),
                 ) from second_error
+            if self._cache is not None:
+                self._cache.set(cache_key, repaired_content)
+            return formatted
+
+        if self._cache is not None:
+            self._cache.set(cache_key, initial_content)
+        return formatted
+
+    async def aformat_issue(self, **kwargs: Any) -> AIFormattedIssue:
+        # The pooled sync client is thread-safe, so a worker thread reuses the same retry,
+        # breaker and cache path as format_issue instead of duplicating it for an async client.
+        return await asyncio.to_thread(self.format_issue, **kwargs)
+
+    async def format_many(
+        self,
+        items: list[dict[str, Any]],
+    ) -> list[AIFormattedIssue | BaseException]:
+        # Each item holds format_issue keyword arguments; results keep input order.
+        semaphore = asyncio.Semaphore(max(1, self._settings.llm_max_concurrency))
+
+        async def format_one(item: dict[str, Any]) -> AIFormattedIssue:
+            async with semaphore:
+                return await self.aformat_issue(**item)
+
+        return await asyncio.gather(*(format_one(item) for item in items), return_exceptions=True)
+
+    def format_packed(self, items: list[dict[str, Any]]) -> list[AIFormattedIssue | BaseException]:
+        """Format several submissions with one chat completion per group of up to eight.
+
+        Each item holds format_issue keyword arguments and results keep input order, like format_many.
+        Bulk formatting then costs one request per group instead of one per note. Any submission the
+        packed answer doesn't cover with a valid report is formatted on its own through format_issue.
+        """
+        if not self._settings.openai_api_key:
+            raise ConfigurationError(
+                "AI formatting is unavailable. Set OPENAI_API_KEY to enable this feature."
+            )
+
+        results: list[AIFormattedIssue | BaseException | None] = [None] * len(items)
+        user_prompts = [self._build_user_prompt(**self._prompt_fields(item)) for item in items]
+        # Keyed exactly as format_issue would key the single request, so packed and single calls share hits.
+        cache_keys = [
+            DiskResponseCache.build_key(
+                self._settings.openai_model,
+                [FORMAT_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}],
+            )
+            for user_prompt in user_prompts
+        ]
+        pending: list[int] = []
+        for idx, cache_key in enumerate(cache_keys):
+            cached = self._cached_format(cache_key)
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending.append(idx)
+
+        for start in range(0, len(pending), self._max_packed_submissions):
+            group = pending[start : start + self._max_packed_submissions]
+            reports = None
+            if len(group) > 1:
+                reports = self._request_packed_reports([user_prompts[idx] for idx in group])
+            for position, idx in enumerate(group):
+                # Single-item groups and failed packed requests have no packed report to validate.
+                if reports is None:
+                    results[idx] = self._format_single(items[idx])
+                    continue
+                report = reports[position]
+                try:
+                    formatted = self._validate_payload(report)
+                except ValidationError as exc:
+                    self._logger.warning(
+                        "Packed AI report invalid; formatting submission individually",
+                        extra={"context": {"error": str(exc)}},
+                    )
+                    results[idx] = self._format_single(items[idx])
+                    continue
+                results[idx] = formatted
+                if self._cache is not None:
+                    self._cache.set(cache_keys[idx], orjson.dumps(report).decode("utf-8"))
+        return results
+
+    def _request_packed_reports(self, user_prompts: list[str]) -> list[object] | None:
+        packed_prompt = "\n\n".join(
+            f"Submission {number}:\n{user_prompt}" for number, user_prompt in enumerate(user_prompts, start=1)
+        )
+        messages = [PACKED_FORMAT_SYSTEM_MESSAGE, {"role": "user", "content": packed_prompt}]
+        try:
+            payload = self._extract_json_payload(self._call_model(messages))
+        except (AIFormattingError, ValueError) as exc:
+            self._logger.warning(
+                "Packed AI request failed; formatting submissions individually",
+                extra={"context": {"error": str(exc), "submissions": len(user_prompts)}},
+            )
+            return None
+        reports = payload.get("reports") if isinstance(payload, dict) else None
+        if not isinstance(reports, list) or len(reports) != len(user_prompts):
+            self._logger.warning(
+                "Packed AI response did not match submissions; formatting them individually",
+                extra={"context": {"submissions": len(user_prompts)}},
+            )
+            return None
+        return reports
+
+    def _format_single(self, item: dict[str, Any]) -> AIFormattedIssue | BaseException:
+        try:
+            return self.format_issue(**item)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    @staticmethod
+    def _prompt_fields(item: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "source": item["source"],
+            "metadata": item["metadata"],
+            "note_text": item.get("note_text"),
+            "image_filename": item.get("image_filename"),
+            "image_size": item.get("image_size", 0),
+            "image_mime": item.get("image_mime"),
+        }
+
+    def _cached_format(self, cache_key: str) -> AIFormattedIssue | None:
+        if self._cache is None:
+            return None
+        cached_content = self._cache.get(cache_key)
+        if cached_content is None:
+            return None
+        try:
+            return self._parse_and_validate(cached_content)
+        except (ValidationError, ValueError):
+            self._logger.warning("Discarding invalid cached AI response")
+            return None
 
     def _repair_once(
         self,
@@ -85,7 +464,7 @@ class OpenAIIssueFormatter:
         metadata: IssueMetadata,
         note_text: str | None,
         image_filename: str | None,
-        image_bytes: bytes | None,
+        image_size: int,
         image_mime: str | None,
     ) -> str:
         submission_context = self._build_user_prompt(
@@ -93,7 +472,7 @@ class OpenAIIssueFormatter:
             metadata=metadata,
             note_text=note_text,
             image_filename=image_filename,
-            image_bytes=image_bytes,
+            image_size=image_size,
             image_mime=image_mime,
         )
         repair_prompt = (
@@ -106,69 +485,176 @@ class OpenAIIssueFormatter:
             f"{JSON_OUTPUT_INSTRUCTIONS}"
         )
         repair_messages = [
-            {"role": "system", "content": TEAM_BRIEF_SYSTEM_PROMPT},
+            REPAIR_SYSTEM_MESSAGE,
             {"role": "user", "content": repair_prompt},
         ]
-        return self._chat_completion(repair_messages)
+        return self._call_model(repair_messages)
 
     def _parse_and_validate(self, model_content: str) -> AIFormattedIssue:
-        payload = self._extract_json_payload(model_content)
-        return AIFormattedIssue.model_validate(payload)
+        try:
+            payload = self._extract_json_payload(model_content)
+        except ValueError:
+            relaxed_content = TRAILING_COMMA_PATTERN.sub(r"\1", model_content)
+            if relaxed_content == model_content:
+                raise
+            payload = self._extract_json_payload(relaxed_content)
+            self._log_local_repair("trailing_comma")
+        return self._validate_payload(payload)
+
+    def _validate_payload(self, payload: object) -> AIFormattedIssue:
+        try:
+            return AI_FORMATTED_ISSUE_ADAPTER.validate_python(payload)
+        except ValidationError:
+            remapped_payload = self._remap_label_synonyms(payload)
+            if remapped_payload is None:
+                raise
+            formatted = AI_FORMATTED_ISSUE_ADAPTER.validate_python(remapped_payload)
+            self._log_local_repair("label_synonym")
+            return formatted
+
+    @staticmethod
+    def _remap_label_synonyms(payload: object) -> dict | None:
+        if not isinstance(payload, dict):
+            return None
+        remapped = dict(payload)
+        changed = False
+        for field_name, synonyms in (("urgency", URGENCY_SYNONYMS), ("category", CATEGORY_SYNONYMS)):
+            value = payload.get(field_name)
+            if isinstance(value, str):
+                replacement = synonyms.get(value.strip().lower())
+                if replacement is not None:
+                    remapped[field_name] = replacement
+                    changed = True
+        return remapped if changed else None
+
+    def _log_local_repair(self, repair_type: str) -> None:
+        self._logger.info(
+            "AI response repaired locally; skipped repair round-trip",
+            extra={"context": {"repair_type": repair_type}},
+        )
 
     def _extract_json_payload(self, model_content: str) -> dict:
+        # response_format=json_object makes the raw content parse on the happy path; fences and
+        # surrounding prose are only recovered on fallback. Non-object JSON fails schema validation.
+        try:
+            return orjson.loads(model_content)
+        except orjson.JSONDecodeError:
+            pass
+
         text = model_content.strip()
         if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*", "", text)
-            text = re.sub(r"\s*```$", "", text)
+            text = FENCE_OPEN_PATTERN.sub("", text)
+            text = FENCE_CLOSE_PATTERN.sub("", text)
 
         try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError:
-            match = re.search(r"\{.*\}", text, re.DOTALL)
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            match = JSON_OBJECT_PATTERN.search(text)
             if not match:
                 raise ValueError("No JSON object found in the AI response.") from None
-            parsed = json.loads(match.group(0))
+            return orjson.loads(match.group(0))
+
+    def _call_model(self, messages: list[dict[str, str]]) -> str:
+        self._breaker.before_call()
+        try:
+            content = self._chat_completion_with_retry(messages)
+        except AIFormattingError as exc:
+            # Only outage-style failures trip the breaker; any other answer proves the service is up.
+            if self._is_retryable(exc):
+                self._breaker.on_failure()
+            else:
+                self._breaker.on_success()
+            raise
+        except BaseException:
+            # Anything unexpected still has to settle the breaker, or a half-open probe would stay in flight
+            # and fast-fail every later call.
+            self._breaker.on_failure()
+            raise
+        self._breaker.on_success()
+        return content
+
+    def _chat_completion_with_retry(self, messages: list[dict[str, str]]) -> str:
+        max_attempts = max(1, self._settings.llm_max_retries)
+        base_delay = self._settings.llm_base_delay_ms / 1000
+        max_delay = self._settings.llm_max_delay_ms / 1000
+        for attempt in range(max_attempts - 1):
+            try:
+                return self._chat_completion(messages)
+            except AIFormattingError as exc:
+                if not self._is_retryable(exc):
+                    raise
+                delay = min(base_delay * 2**attempt + random.uniform(0, base_delay), max_delay)
+                self._logger.warning(
+                    "Transient AI service error; retrying",
+                    extra={
+                        "context": {
+                            "attempt": attempt + 1,
+                            "http_status": exc.http_status,
+                            "delay_seconds": round(delay, 3),
+                        }
+                    },
+                )
+                time.sleep(delay)
+        return self._chat_completion(messages)
 
-        if not isinstance(parsed, dict):
-            raise ValueError("AI response JSON must be an object.")
-        return parsed
+    @staticmethod
+    def _is_retryable(error: AIFormattingError) -> bool:
+        if error.http_status is not None:
+            return error.http_status in RETRYABLE_HTTP_STATUSES
+        return isinstance(error.__cause__, httpx.TransportError)
 
     def _chat_completion(self, messages: list[dict[str, str]]) -> str:
-        payload = {
-            "model": self._settings.openai_model,
-            "messages": messages,
-            "temperature": 0.2,
-            "response_format": {"type": "json_object"},
-        }
-        request = Request(
-            self._settings.openai_chat_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {self._settings.openai_api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+        payload = {**self._base_payload, "messages": messages}
 
+        content_parts: list[str] = []
         try:
-            with urlopen(request, timeout=self._settings.request_timeout_seconds) as response:
-                body = response.read().decode("utf-8")
-        except HTTPError as exc:
-            response_text = exc.read().decode("utf-8", errors="replace")
+            with self._http.stream(
+                "POST",
+                self._settings.openai_chat_url,
+                content=orjson.dumps(payload),
+                headers={
+                    "Authorization": f"Bearer {self._settings.openai_api_key}",
+                    "Content-Type": "application/json",
+                },
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    response.raise_for_status()
+                for line in response.iter_lines():
+                    content_parts.append(self._parse_stream_line(line))
+        except httpx.HTTPStatusError as exc:
             raise AIFormattingError(
                 "AI service is temporarily unavailable. Please try again shortly.",
-                detail=f"HTTP {exc.code}: {response_text}",
+                detail=f"HTTP {exc.response.status_code}: {exc.response.text}",
+                http_status=exc.response.status_code,
             ) from exc
-        except URLError as exc:
+        except httpx.RequestError as exc:
             raise AIFormattingError(
                 "Network error while contacting AI service. Please retry.",
-                detail=str(exc.reason),
+                detail=str(exc),
             ) from exc
 
+        content = "".join(content_parts)
+        if not content:
+            raise AIFormattingError(
+                "AI service returned an unexpected response format.",
+                detail="Streamed response contained no content.",
+            )
+        return content
+
+    @staticmethod
+    def _parse_stream_line(line: str) -> str:
+        if not line.startswith("data:"):
+            return ""
+        data = line[len("data:"):].strip()
+        if not data or data == "[DONE]":
+            return ""
         try:
-            parsed_response = json.loads(body)
-            return parsed_response["choices"][0]["message"]["content"]
-        except (KeyError, IndexError, TypeError, json.JSONDecodeError) as exc:
+            choices = orjson.loads(data).get("choices") or []
+            if not choices:
+                return ""
+            return choices[0]["delta"].get("content") or ""
+        except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as exc:
             raise AIFormattingError(
                 "AI service returned an unexpected response format.",
                 detail=str(exc),
@@ -180,13 +666,12 @@ class OpenAIIssueFormatter:
         metadata: IssueMetadata,
         note_text: str | None,
         image_filename: str | None,
-        image_bytes: bytes | None,
+        image_size: int,
         image_mime: str | None,
     ) -> str:
         note_block = note_text if note_text else "[none provided]"
         image_name = image_filename if image_filename else "[none provided]"
         mime_block = image_mime if image_mime else "Unknown"
-        image_size = len(image_bytes) if image_bytes else 0
         area = metadata.area if metadata.area else "Unknown"
 
         return (
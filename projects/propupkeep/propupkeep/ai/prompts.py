@@ -14,8 +14,7 @@ Classification goals:
 """
 
 
-JSON_OUTPUT_INSTRUCTIONS = """Return ONLY a valid JSON object with exactly these keys:
-- issue (string)
+REPORT_FIELD_SPEC = """- issue (string)
 - reported_observation (string)
 - urgency (string: High | Medium | Low | Unknown)
 - category (string: Safety | Plumbing | Electrical | HVAC | Appliance | Cosmetic | General | Unknown)
@@ -24,6 +23,19 @@ JSON_OUTPUT_INSTRUCTIONS = """Return ONLY a valid JSON object with exactly these
 - confidence (object with keys category and urgency; each is a float between 0.0 and 1.0)
 - needs_followup (boolean)
 - followup_questions (array of strings; must be non-empty when needs_followup is true)
-- photo_observation (string or null)
+- photo_observation (string or null)"""
+
+JSON_OUTPUT_INSTRUCTIONS = f"""Return ONLY a valid JSON object with exactly these keys:
+{REPORT_FIELD_SPEC}
+
+Never include markdown, code fences, comments, or extra keys."""
+
+
+PACKED_JSON_OUTPUT_INSTRUCTIONS = f"""Several numbered submissions are provided. Treat each one independently and never mix facts between them.
+Return ONLY a valid JSON object with exactly one key:
+- reports (array with exactly one report per submission, in submission order)
+
+Each report is an object with exactly these keys:
+{REPORT_FIELD_SPEC}
 
 Never include markdown, code fences, comments, or extra keys."""
@@ -5,7 +5,7 @@ from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -15,14 +15,26 @@ PROJECT_ENV_FILE = PROJECT_ROOT / ".env"
 load_dotenv(dotenv_path=PROJECT_ENV_FILE, override=False)
 
 
+@lru_cache(maxsize=1)
 def _resolve_data_file() -> Path:
     return _resolve_project_path("DATA_FILE", "propupkeep/data/activity.jsonl")
 
 
+@lru_cache(maxsize=1)
+def _resolve_sqlite_file() -> Path:
+    return _resolve_project_path("SQLITE_FILE", "propupkeep/data/activity.sqlite3")
+
+
+@lru_cache(maxsize=1)
 def _resolve_uploads_dir() -> Path:
     return _resolve_project_path("UPLOADS_DIR", "propupkeep/data/uploads")
 
 
+@lru_cache(maxsize=1)
+def _resolve_ai_cache_dir() -> Path:
+    return _resolve_project_path("AI_CACHE_DIR", "propupkeep/data/ai_cache")
+
+
 def _resolve_project_path(env_key: str, default_relative: str) -> Path:
     env_value = os.getenv(env_key)
     if env_value:
@@ -34,6 +46,10 @@ def _resolve_project_path(env_key: str, default_relative: str) -> Path:
 
 
 class Settings(BaseModel):
+    # Env-backed factories run once per instance; get_settings() keeps a single frozen,
+    # hashable instance per process so it can also key downstream caches.
+    model_config = ConfigDict(frozen=True)
+
     project_root: Path = Field(default=PROJECT_ROOT)
     app_name: str = "PropUpkeep MVP"
     app_env: str = Field(default_factory=lambda: os.getenv("APP_ENV", "development"))
@@ -51,16 +67,54 @@ class Settings(BaseModel):
     request_timeout_seconds: int = Field(
         default_factory=lambda: int(os.getenv("OPENAI_TIMEOUT_SECONDS", "45"))
     )
+    llm_max_retries: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_RETRIES", "3")))
+    llm_base_delay_ms: int = Field(default_factory=lambda: int(os.getenv("LLM_BASE_DELAY_MS", "500")))
+    llm_max_delay_ms: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_DELAY_MS", "8000")))
+    llm_max_concurrency: int = Field(
+        default_factory=lambda: int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+    )
+    breaker_fail_threshold: int = Field(
+        default_factory=lambda: int(os.getenv("LLM_BREAKER_FAIL_THRESHOLD", "5"))
+    )
+    breaker_recovery_seconds: int = Field(
+        default_factory=lambda: int(os.getenv("LLM_BREAKER_RECOVERY_SECONDS", "60"))
+    )
+
+    enable_ai_cache: bool = Field(
+        default_factory=lambda: os.getenv("ENABLE_AI_CACHE", "true").strip().lower() in {"1", "true", "yes"}
+    )
+    ai_cache_ttl_seconds: int = Field(
+        default_factory=lambda: int(os.getenv("AI_CACHE_TTL_SECONDS", "86400"))
+    )
+    enable_ai_prefetch: bool = Field(
+        default_factory=lambda: (
+            os.getenv("ENABLE_AI_PREFETCH", "false").strip().lower() in {"1", "true", "yes"}
+        )
+    )
+
+    # "jsonl" (append-only log, the default) or "sqlite" (WAL-mode database at SQLITE_FILE).
+    storage_backend: str = Field(
+        default_factory=lambda: os.getenv("STORAGE_BACKEND", "jsonl").strip().lower()
+    )
+    durable_writes: bool = Field(
+        default_factory=lambda: os.getenv("DURABLE_WRITES", "false").strip().lower() in {"1", "true", "yes"}
+    )
 
     max_upload_mb: int = Field(default_factory=lambda: int(os.getenv("MAX_UPLOAD_MB", "5")))
     max_input_chars: int = Field(default_factory=lambda: int(os.getenv("MAX_INPUT_CHARS", "3000")))
     data_file: Path = Field(default_factory=_resolve_data_file)
+    sqlite_file: Path = Field(default_factory=_resolve_sqlite_file)
     uploads_dir: Path = Field(default_factory=_resolve_uploads_dir)
+    ai_cache_dir: Path = Field(default_factory=_resolve_ai_cache_dir)
 
     @property
     def max_upload_bytes(self) -> int:
         return self.max_upload_mb * 1024 * 1024
 
+    @property
+    def activity_store_file(self) -> Path:
+        return self.sqlite_file if self.storage_backend == "sqlite" else self.data_file
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
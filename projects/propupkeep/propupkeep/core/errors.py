@@ -18,6 +18,15 @@ class ConfigurationError(UserVisibleError):
 class AIFormattingError(UserVisibleError):
     """AI response could not be validated."""
 
+    def __init__(
+        self,
+        user_message: str,
+        detail: str | None = None,
+        http_status: int | None = None,
+    ) -> None:
+        super().__init__(user_message, detail=detail)
+        self.http_status = http_status
+
 
 class PersistenceError(UserVisibleError):
     """Storage operation failed."""
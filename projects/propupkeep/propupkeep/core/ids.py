@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+import threading
+from uuid import UUID
+
+
+_ENTROPY_POOL_BYTES = 4096
+_entropy_pool = bytearray()
+_entropy_lock = threading.Lock()
+
+
+def new_uuid4_str() -> str:
+    # One urandom call refills enough entropy for 256 ids instead of one syscall per id.
+    global _entropy_pool
+    with _entropy_lock:
+        if len(_entropy_pool) < 16:
+            _entropy_pool = bytearray(os.urandom(_ENTROPY_POOL_BYTES))
+        raw = _entropy_pool[-16:]
+        del _entropy_pool[-16:]
+    return str(UUID(bytes=bytes(raw), version=4))
+
+
+def _reset_entropy_pool() -> None:
+    # A forked child inherits the parent's unused entropy and would hand out the same ids; like the stdlib
+    # random module, start it from fresh urandom bytes instead.
+    global _entropy_pool, _entropy_lock
+    _entropy_pool = bytearray()
+    _entropy_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_entropy_pool)
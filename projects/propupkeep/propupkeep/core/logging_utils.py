@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 
+import orjson
+
 
 class JsonLogFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__()
+        # (epoch second, ISO prefix) swapped as one tuple so handler threads never see a torn pair.
+        self._cached_second: tuple[int, str] = (-1, "")
+
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, object] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -18,7 +24,17 @@ class JsonLogFormatter(logging.Formatter):
             payload["context"] = context
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, default=str)
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def _format_timestamp(self, created: float) -> str:
+        # Records arrive in bursts within the same second; only the fraction changes between them.
+        second = int(created)
+        cached_second, second_iso = self._cached_second
+        if second != cached_second:
+            second_iso = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._cached_second = (second, second_iso)
+        microseconds = int((created - second) * 1_000_000)
+        return f"{second_iso}.{microseconds:06d}+00:00"
 
 
 def configure_logging(log_level: str = "INFO") -> None:
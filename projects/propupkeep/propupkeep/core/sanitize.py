@@ -3,15 +3,23 @@ from __future__ import annotations
 import re
 
 
+# Strips every control character except tab and newline (\r included), in one pass.
 CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
+CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x09), *range(0x0B, 0x20), 0x7F])
 FILENAME_SAFE_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9._-]")
+# Leading magic bytes of the accepted upload formats; the declared Content-Type is client-controlled.
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+)
+IMAGE_SIGNATURE_BYTES = max(len(signature) for signature, _ in IMAGE_SIGNATURES)
 
 
 def sanitize_user_text(text: str, max_chars: int) -> str:
-    cleaned = CONTROL_CHARS_PATTERN.sub("", text or "")
-    cleaned = cleaned.replace("\r\n", "\n").replace("\r", "\n")
-    cleaned = cleaned[:max_chars]
-    return cleaned.strip()
+    text = text or ""
+    # str.translate beats the regex several times over on ASCII input but is far slower on anything else.
+    cleaned = text.translate(CONTROL_CHARS_TABLE) if text.isascii() else CONTROL_CHARS_PATTERN.sub("", text)
+    return cleaned[:max_chars].strip()
 
 
 def sanitize_filename(filename: str) -> str:
@@ -19,3 +27,10 @@ def sanitize_filename(filename: str) -> str:
         return "upload"
     sanitized = FILENAME_SAFE_CHARS_PATTERN.sub("_", filename)
     return sanitized[:255]
+
+
+def sniff_image_mime(header: bytes) -> str | None:
+    for signature, mime in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    return None
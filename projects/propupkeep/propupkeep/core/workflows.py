@@ -1,24 +1,42 @@
 from __future__ import annotations
 
+import os
 from io import BytesIO
 from pathlib import Path
-from uuid import uuid4
+from typing import TYPE_CHECKING, BinaryIO
 
 from PIL import Image, ImageOps, UnidentifiedImageError
+from pydantic import ValidationError
 
-from propupkeep.ai.formatter import OpenAIIssueFormatter
 from propupkeep.core.errors import UserVisibleError
+from propupkeep.core.ids import new_uuid4_str
 from propupkeep.core.logging_utils import get_logger
-from propupkeep.core.sanitize import sanitize_filename, sanitize_user_text
-from propupkeep.models.issue import COMMENT_AUTHOR_ROLES, Comment, IssueMetadata, IssueReport, IssueSource, Status
+from propupkeep.core.sanitize import (
+    IMAGE_SIGNATURE_BYTES,
+    sanitize_filename,
+    sanitize_user_text,
+    sniff_image_mime,
+)
+from propupkeep.models.issue import (
+    COMMENT_AUTHOR_ROLES,
+    MAX_NOTE_CHARS,
+    Comment,
+    IssueMetadata,
+    IssueReport,
+    IssueSource,
+    Status,
+)
 from propupkeep.services.router import IssueRouter
 from propupkeep.storage.repository import IssueRepository
 
+if TYPE_CHECKING:
+    # Only needed for annotations; the formatter pulls in httpx, so callers import it when they build one.
+    from propupkeep.ai.formatter import OpenAIIssueFormatter
+
 
 class IssueWorkflowService:
     _max_saved_image_width = 800
     _max_comment_chars = 800
-    _allowed_image_mime = {"image/png", "image/jpeg", "image/jpg"}
     _mime_to_extension = {
         "image/png": ".png",
         "image/jpeg": ".jpg",
@@ -38,7 +56,8 @@ class IssueWorkflowService:
         self._formatter = formatter
         self._router = router
         self._repository = repository
-        self._max_input_chars = max_input_chars
+        # Notes longer than IssueReport accepts would be saved and then dropped by every read.
+        self._max_input_chars = min(max_input_chars, MAX_NOTE_CHARS)
         self._max_upload_bytes = max_upload_bytes
         self._project_root = project_root.resolve()
         self._uploads_dir = uploads_dir.resolve()
@@ -53,31 +72,39 @@ class IssueWorkflowService:
         image_bytes: bytes | None = None,
         image_filename: str | None = None,
         image_mime: str | None = None,
+        image_stream: BinaryIO | None = None,
     ) -> IssueReport:
+        # A seekable stream (e.g. the uploaded file object) is decoded in place; raw bytes are
+        # wrapped without copying so both inputs share one code path.
+        if image_stream is None and image_bytes:
+            image_stream = BytesIO(image_bytes)
+        image_size = self._stream_size(image_stream) if image_stream is not None else 0
+
         sanitized_note_text = sanitize_user_text(note_text, max_chars=self._max_input_chars)
         sanitized_filename = sanitize_filename(image_filename) if image_filename else None
         sanitized_metadata = self._sanitize_metadata(metadata)
 
         has_note = bool(sanitized_note_text)
-        has_image = bool(image_bytes)
+        has_image = image_size > 0
         if not has_note and not has_image:
             raise UserVisibleError("Please add a note or a photo before submitting.")
         if source in {IssueSource.UNIT_NOTES, IssueSource.QUICK_VOICE} and not has_note:
             raise UserVisibleError("Please enter notes before formatting for the team.")
-        if has_image and len(image_bytes) > self._max_upload_bytes:
+        if has_image and image_size > self._max_upload_bytes:
             raise UserVisibleError("The uploaded image is too large. Please upload a smaller file.")
-        normalized_image_mime = self._normalize_image_mime(image_mime) if has_image else None
+        # The format comes from the file's magic bytes; the declared image_mime is client-supplied.
+        normalized_image_mime = self._sniff_image_mime(image_stream) if has_image else None
         if has_image and not normalized_image_mime:
             raise UserVisibleError("Unsupported image type. Please upload PNG or JPEG.")
 
-        report_id = str(uuid4())
+        report_id = new_uuid4_str()
 
         raw_observations = self._build_observation_context(
             source=source,
             metadata=sanitized_metadata,
             note_text=sanitized_note_text,
             image_filename=sanitized_filename,
-            image_bytes=image_bytes,
+            image_size=image_size,
             image_mime=normalized_image_mime,
         )
 
@@ -86,7 +113,7 @@ class IssueWorkflowService:
             metadata=sanitized_metadata,
             note_text=sanitized_note_text or None,
             image_filename=sanitized_filename,
-            image_bytes=image_bytes,
+            image_size=image_size,
             image_mime=normalized_image_mime,
         )
         recipients = self._router.route_recipients(
@@ -95,38 +122,47 @@ class IssueWorkflowService:
         )
 
         image_path = None
-        if has_image and image_bytes and normalized_image_mime:
+        if has_image and image_stream is not None and normalized_image_mime:
             image_path = self._save_image_upload(
                 report_id=report_id,
-                image_bytes=image_bytes,
+                image_stream=image_stream,
                 image_filename=sanitized_filename,
                 image_mime=normalized_image_mime,
             )
 
-        report = IssueReport(
-            report_id=report_id,
-            source=source,
-            property_name=sanitized_metadata.property_name,
-            building=sanitized_metadata.building,
-            unit_number=sanitized_metadata.unit_number,
-            area=sanitized_metadata.area,
-            note_text=sanitized_note_text or None,
-            image_filename=sanitized_filename,
-            image_path=image_path,
-            image_mime=normalized_image_mime,
-            raw_observations=raw_observations,
-            reported_observation=formatted_issue.reported_observation,
-            issue=formatted_issue.issue,
-            urgency=formatted_issue.urgency,
-            category=formatted_issue.category,
-            recommended_action=formatted_issue.recommended_action,
-            extracted_entities=formatted_issue.extracted_entities,
-            confidence=formatted_issue.confidence,
-            needs_followup=formatted_issue.needs_followup,
-            followup_questions=formatted_issue.followup_questions,
-            photo_observation=formatted_issue.photo_observation,
-            recipients=recipients,
-        )
+        # Validated here, at the write boundary: a record the read path would reject must never be persisted.
+        try:
+            report = IssueReport(
+                report_id=report_id,
+                source=source,
+                property_name=sanitized_metadata.property_name,
+                building=sanitized_metadata.building,
+                unit_number=sanitized_metadata.unit_number,
+                area=sanitized_metadata.area,
+                note_text=sanitized_note_text or None,
+                image_filename=sanitized_filename,
+                image_path=image_path,
+                image_mime=normalized_image_mime,
+                raw_observations=raw_observations,
+                reported_observation=formatted_issue.reported_observation,
+                issue=formatted_issue.issue,
+                urgency=formatted_issue.urgency,
+                category=formatted_issue.category,
+                recommended_action=formatted_issue.recommended_action,
+                extracted_entities=formatted_issue.extracted_entities,
+                confidence=formatted_issue.confidence,
+                needs_followup=formatted_issue.needs_followup,
+                followup_questions=formatted_issue.followup_questions,
+                photo_observation=formatted_issue.photo_observation,
+                recipients=recipients,
+            )
+        except ValidationError as exc:
+            if image_path:
+                (self._project_root / image_path).unlink(missing_ok=True)
+            raise UserVisibleError(
+                "This report could not be saved. Please review the details and try again.",
+                detail=str(exc),
+            ) from exc
 
         self._repository.upsert_issue(report)
         self._logger.info(
@@ -200,6 +236,20 @@ class IssueWorkflowService:
     def list_recent_activity(self, limit: int = 100) -> list[dict]:
         return self._repository.list_recent_activity(limit=limit)
 
+    def prefetch_issue(self, source: IssueSource, note_text: str, metadata: IssueMetadata) -> None:
+        # Same formatter arguments submit_issue passes for a photo-less note, so the submit reuses the result.
+        sanitized_note_text = sanitize_user_text(note_text, max_chars=self._max_input_chars)
+        if not sanitized_note_text:
+            return
+        self._formatter.prefetch_issue(
+            source=source,
+            metadata=self._sanitize_metadata(metadata),
+            note_text=sanitized_note_text,
+            image_filename=None,
+            image_size=0,
+            image_mime=None,
+        )
+
     def _sanitize_metadata(self, metadata: IssueMetadata) -> IssueMetadata:
         return IssueMetadata(
             property_name=sanitize_user_text(metadata.property_name, max_chars=120),
@@ -214,39 +264,42 @@ class IssueWorkflowService:
         metadata: IssueMetadata,
         note_text: str,
         image_filename: str | None,
-        image_bytes: bytes | None,
+        image_size: int,
         image_mime: str | None,
     ) -> str:
-        area = metadata.area or "Unknown"
-        note_block = note_text or "[none provided]"
-        image_name = image_filename or "[none provided]"
-        mime_block = image_mime or "Unknown"
-        image_length = len(image_bytes) if image_bytes else 0
-        context = (
-            f"Source: {source.value}\n"
-            f"Property: {metadata.property_name}\n"
-            f"Building: {metadata.building}\n"
-            f"Unit: {metadata.unit_number}\n"
-            f"Area: {area}\n"
-            f"Note: {note_block}\n"
-            f"Image Filename: {image_name}\n"
-            f"Image Mime: {mime_block}\n"
-            f"Image Bytes Length: {image_length}"
+        context = "\n".join(
+            (
+                f"Source: {source.value}",
+                f"Property: {metadata.property_name}",
+                f"Building: {metadata.building}",
+                f"Unit: {metadata.unit_number}",
+                f"Area: {metadata.area or 'Unknown'}",
+                f"Note: {note_text or '[none provided]'}",
+                f"Image Filename: {image_filename or '[none provided]'}",
+                f"Image Mime: {image_mime or 'Unknown'}",
+                f"Image Bytes Length: {image_size}",
+            )
         )
         return context[:4000]
 
-    def _normalize_image_mime(self, image_mime: str | None) -> str | None:
-        if not image_mime:
-            return None
-        normalized = image_mime.strip().lower()
-        if normalized in self._allowed_image_mime:
-            return normalized
-        return None
+    @staticmethod
+    def _stream_size(image_stream: BinaryIO) -> int:
+        image_stream.seek(0, os.SEEK_END)
+        size = image_stream.tell()
+        image_stream.seek(0)
+        return size
+
+    @staticmethod
+    def _sniff_image_mime(image_stream: BinaryIO) -> str | None:
+        image_stream.seek(0)
+        header = image_stream.read(IMAGE_SIGNATURE_BYTES)
+        image_stream.seek(0)
+        return sniff_image_mime(header)
 
     def _save_image_upload(
         self,
         report_id: str,
-        image_bytes: bytes,
+        image_stream: BinaryIO,
         image_filename: str | None,
         image_mime: str,
     ) -> str:
@@ -255,24 +308,27 @@ class IssueWorkflowService:
             extension = self._mime_to_extension[image_mime]
 
         target_name = f"{report_id}{extension}"
-        uploads_root = self._uploads_dir.resolve()
-        target_path = (uploads_root / target_name).resolve()
-        if uploads_root not in target_path.parents:
+        # _uploads_dir is resolved once in __init__; the name is server-generated, so a single
+        # parent comparison is enough defense-in-depth without another resolve() per upload.
+        target_path = self._uploads_dir / target_name
+        if target_path.parent != self._uploads_dir:
             raise UserVisibleError("Invalid upload target path.")
 
         try:
-            with Image.open(BytesIO(image_bytes)) as image:
+            image_stream.seek(0)
+            with Image.open(image_stream) as image:
                 normalized_image = ImageOps.exif_transpose(image)
                 resized_image = self._resize_for_storage(normalized_image)
 
                 if extension == ".png":
                     if resized_image.mode not in {"RGB", "RGBA", "L", "P"}:
                         resized_image = resized_image.convert("RGBA")
-                    resized_image.save(target_path, format="PNG", optimize=True)
+                    self._save_image_exclusive(resized_image, target_path, format="PNG", optimize=True)
                 else:
                     if resized_image.mode not in {"RGB", "L"}:
                         resized_image = resized_image.convert("RGB")
-                    resized_image.save(
+                    self._save_image_exclusive(
+                        resized_image,
                         target_path,
                         format="JPEG",
                         optimize=True,
@@ -292,6 +348,18 @@ class IssueWorkflowService:
             raise UserVisibleError("Could not resolve upload storage path safely.") from exc
         return str(relative_path)
 
+    @staticmethod
+    def _save_image_exclusive(image: Image.Image, target_path: Path, **save_options: object) -> None:
+        # O_EXCL never overwrites an existing upload and O_NOFOLLOW refuses a planted symlink.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(target_path, flags, 0o644)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                image.save(handle, **save_options)
+        except BaseException:
+            target_path.unlink(missing_ok=True)
+            raise
+
     def _resize_for_storage(self, image: Image.Image) -> Image.Image:
         if image.width <= self._max_saved_image_width:
             return image.copy()
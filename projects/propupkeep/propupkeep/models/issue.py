@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from propupkeep.core.ids import new_uuid4_str
+
 
 class Urgency(str, Enum):
     HIGH = "High"
@@ -42,6 +43,24 @@ class Status(str, Enum):
 
 
 COMMENT_AUTHOR_ROLES = ("Leasing", "Maintenance", "Safety", "PM", "Vendor", "Other")
+MAX_NOTE_CHARS = 3000
+
+_URGENCY_BY_NAME = {urgency.value.lower(): urgency for urgency in Urgency}
+_CATEGORY_BY_NAME = {category.value.lower(): category for category in IssueCategory}
+_ALLOWED_IMAGE_MIMES = frozenset({"image/png", "image/jpeg", "image/jpg"})
+_SOURCE_BY_ALIAS = {
+    "quick_snap": IssueSource.QUICK_SNAP,
+    "quick snap": IssueSource.QUICK_SNAP,
+    "photo": IssueSource.QUICK_SNAP,
+    "unit_notes": IssueSource.UNIT_NOTES,
+    "unit notes": IssueSource.UNIT_NOTES,
+    "note": IssueSource.UNIT_NOTES,
+    "quick_voice": IssueSource.QUICK_VOICE,
+    "quick voice": IssueSource.QUICK_VOICE,
+    "voice": IssueSource.QUICK_VOICE,
+    "unknown": IssueSource.UNKNOWN,
+    "": IssueSource.UNKNOWN,
+}
 
 
 class ExtractedEntities(BaseModel):
@@ -100,7 +119,7 @@ class IssueMetadata(BaseModel):
 class Comment(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    comment_id: str = Field(default_factory=lambda: str(uuid4()))
+    comment_id: str = Field(default_factory=new_uuid4_str)
     author_name: str = Field(..., min_length=1, max_length=80)
     author_role: str = Field(..., min_length=1, max_length=30)
     message: str = Field(..., min_length=1, max_length=1000)
@@ -142,32 +161,16 @@ class AIFormattedIssue(BaseModel):
     @classmethod
     def normalize_urgency(cls, value: Urgency | str) -> Urgency | str:
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            mapping = {
-                "high": Urgency.HIGH,
-                "medium": Urgency.MEDIUM,
-                "low": Urgency.LOW,
-                "unknown": Urgency.UNKNOWN,
-            }
-            return mapping.get(normalized, value.strip())
+            stripped = value.strip()
+            return _URGENCY_BY_NAME.get(stripped.lower(), stripped)
         return value
 
     @field_validator("category", mode="before")
     @classmethod
     def normalize_category(cls, value: IssueCategory | str) -> IssueCategory | str:
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            mapping = {
-                "safety": IssueCategory.SAFETY,
-                "plumbing": IssueCategory.PLUMBING,
-                "electrical": IssueCategory.ELECTRICAL,
-                "hvac": IssueCategory.HVAC,
-                "appliance": IssueCategory.APPLIANCE,
-                "cosmetic": IssueCategory.COSMETIC,
-                "general": IssueCategory.GENERAL,
-                "unknown": IssueCategory.UNKNOWN,
-            }
-            return mapping.get(normalized, value.strip())
+            stripped = value.strip()
+            return _CATEGORY_BY_NAME.get(stripped.lower(), stripped)
         return value
 
     @field_validator("followup_questions", mode="before")
@@ -200,13 +203,13 @@ class AIFormattedIssue(BaseModel):
 class IssueReport(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    report_id: str = Field(default_factory=lambda: str(uuid4()))
+    report_id: str = Field(default_factory=new_uuid4_str)
     source: IssueSource = IssueSource.UNKNOWN
     property_name: str = Field(..., min_length=1, max_length=120)
     building: str = Field(..., min_length=1, max_length=120)
     unit_number: str = Field(..., min_length=1, max_length=30)
     area: str | None = Field(default=None, max_length=120)
-    note_text: str | None = Field(default=None, max_length=3000)
+    note_text: str | None = Field(default=None, max_length=MAX_NOTE_CHARS)
     image_filename: str | None = Field(default=None, max_length=255)
     image_path: str | None = Field(default=None, max_length=500)
     image_mime: str | None = Field(default=None, max_length=50)
@@ -257,20 +260,7 @@ class IssueReport(BaseModel):
             return value
 
         normalized = str(value or "").strip().lower()
-        source_map = {
-            "quick_snap": IssueSource.QUICK_SNAP,
-            "quick snap": IssueSource.QUICK_SNAP,
-            "photo": IssueSource.QUICK_SNAP,
-            "unit_notes": IssueSource.UNIT_NOTES,
-            "unit notes": IssueSource.UNIT_NOTES,
-            "note": IssueSource.UNIT_NOTES,
-            "quick_voice": IssueSource.QUICK_VOICE,
-            "quick voice": IssueSource.QUICK_VOICE,
-            "voice": IssueSource.QUICK_VOICE,
-            "unknown": IssueSource.UNKNOWN,
-            "": IssueSource.UNKNOWN,
-        }
-        return source_map.get(normalized, IssueSource.UNKNOWN)
+        return _SOURCE_BY_ALIAS.get(normalized, IssueSource.UNKNOWN)
 
     @model_validator(mode="after")
     def validate_comment_timestamps(self) -> IssueReport:
@@ -293,8 +283,7 @@ class IssueReport(BaseModel):
     def validate_image_mime(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        allowed = {"image/png", "image/jpeg", "image/jpg"}
         normalized = value.lower().strip()
-        if normalized not in allowed:
+        if normalized not in _ALLOWED_IMAGE_MIMES:
             raise ValueError("image_mime must be one of image/png, image/jpeg, image/jpg.")
         return normalized
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from io import BytesIO
+from operator import attrgetter
+from queue import Empty, Full, LifoQueue
+from typing import BinaryIO
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+import orjson
+from pydantic import BaseModel
 
 from propupkeep.models.issue import IssueReport
 
@@ -36,49 +39,103 @@ EXPORT_COLUMNS = [
     "latest_comment_at",
 ]
 
+# Finished exports are copied out with getvalue(), so buffers can be reused. Rewinding rather than
+# truncating to zero keeps each buffer's allocation from the previous export.
+_EXPORT_BUFFER_POOL: LifoQueue[BytesIO] = LifoQueue(maxsize=4)
+
 
 def export_issues_to_excel_bytes(issues: list[IssueReport]) -> bytes:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "Issue Reports"
-    worksheet.append(EXPORT_COLUMNS)
+    output = _acquire_export_buffer()
+    try:
+        export_issues_to_excel_stream(issues, output)
+        output.truncate()
+        return output.getvalue()
+    finally:
+        _release_export_buffer(output)
+
+
+def export_issues_to_excel_stream(issues: list[IssueReport], out: BinaryIO) -> None:
+    # Writes the workbook straight into `out` (e.g. a response body) without an in-memory copy.
+    # openpyxl is only needed when someone actually downloads an export.
+    from openpyxl import Workbook
+
+    column_widths = [len(column_name) for column_name in EXPORT_COLUMNS]
+    rows: list[list[object]] = []
+    # Confidence/entity values repeat across issues; serialize each distinct value once.
+    confidence_json_cache: dict[tuple, str] = {}
+    entities_json_cache: dict[tuple, str] = {}
 
     for issue in issues:
-        latest_comment = _get_latest_comment(issue)
-        worksheet.append(
-            [
-                issue.report_id,
-                _to_excel_datetime(issue.created_at),
-                _to_excel_datetime(issue.updated_at),
-                issue.status.value,
-                issue.source.value,
-                issue.property_name,
-                issue.building,
-                issue.unit_number,
-                issue.area or "",
-                issue.issue,
-                issue.urgency.value,
-                issue.category.value,
-                issue.recommended_action,
-                issue.reported_observation,
-                ", ".join(issue.recipients),
-                ", ".join(issue.followup_questions),
-                json.dumps(issue.confidence.model_dump(mode="json"), ensure_ascii=True),
-                getattr(issue, "location_conflict", "") or "",
-                issue.image_filename or "",
-                json.dumps(issue.extracted_entities.model_dump(mode="json"), ensure_ascii=True),
-                len(issue.comments),
-                latest_comment["message"],
-                latest_comment["created_at"],
-            ]
-        )
-
-    _apply_column_widths(worksheet)
+        row = _build_export_row(issue, confidence_json_cache, entities_json_cache)
+        for idx, cell_value in enumerate(row):
+            cell_length = len(cell_value) if isinstance(cell_value, str) else len(str(cell_value))
+            if cell_length > column_widths[idx]:
+                column_widths[idx] = cell_length
+        rows.append(row)
+
+    # Write-only sheets stream rows straight to XML, but column widths must be set before the
+    # first append, so rows are collected as plain lists first.
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Issue Reports")
+    _apply_column_widths(worksheet, column_widths)
+    worksheet.append(EXPORT_COLUMNS)
+    for row in rows:
+        worksheet.append(row)
 
-    output = BytesIO()
-    workbook.save(output)
+    workbook.save(out)
     workbook.close()
-    return output.getvalue()
+
+
+def _build_export_row(
+    issue: IssueReport,
+    confidence_json_cache: dict[tuple, str],
+    entities_json_cache: dict[tuple, str],
+) -> list[object]:
+    latest_comment = _get_latest_comment(issue)
+    return [
+        issue.report_id,
+        _to_excel_datetime(issue.created_at),
+        _to_excel_datetime(issue.updated_at),
+        issue.status.value,
+        issue.source.value,
+        issue.property_name,
+        issue.building,
+        issue.unit_number,
+        issue.area or "",
+        issue.issue,
+        issue.urgency.value,
+        issue.category.value,
+        issue.recommended_action,
+        issue.reported_observation,
+        ", ".join(issue.recipients),
+        ", ".join(issue.followup_questions),
+        _model_json_cached(issue.confidence, confidence_json_cache),
+        getattr(issue, "location_conflict", "") or "",
+        issue.image_filename or "",
+        _model_json_cached(issue.extracted_entities, entities_json_cache),
+        len(issue.comments),
+        latest_comment["message"],
+        latest_comment["created_at"],
+    ]
+
+
+_comment_created_at = attrgetter("created_at")
+
+
+def _acquire_export_buffer() -> BytesIO:
+    try:
+        output = _EXPORT_BUFFER_POOL.get_nowait()
+    except Empty:
+        return BytesIO()
+    output.seek(0)
+    return output
+
+
+def _release_export_buffer(output: BytesIO) -> None:
+    try:
+        _EXPORT_BUFFER_POOL.put_nowait(output)
+    except Full:
+        pass
 
 
 def _to_excel_datetime(value: datetime | None) -> str:
@@ -91,30 +148,42 @@ def _to_excel_datetime(value: datetime | None) -> str:
     return as_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
+def _model_json_cached(model: BaseModel, cache: dict[tuple, str]) -> str:
+    # Confidence and entities are flat models of floats and string lists, which orjson
+    # serializes directly, so there is no need for a generic model_dump per row.
+    field_names = type(model).model_fields
+    values = [getattr(model, field_name) for field_name in field_names]
+    key = tuple(tuple(value) if isinstance(value, list) else value for value in values)
+    serialized = cache.get(key)
+    if serialized is None:
+        serialized = orjson.dumps(dict(zip(field_names, values))).decode("utf-8")
+        cache[key] = serialized
+    return serialized
+
+
 def _get_latest_comment(issue: IssueReport) -> dict[str, str]:
     if not issue.comments:
         return {"message": "", "created_at": ""}
-    latest = max(issue.comments, key=lambda comment: comment.created_at)
+    latest = max(issue.comments, key=_comment_created_at)
     return {
         "message": latest.message,
         "created_at": _to_excel_datetime(latest.created_at),
     }
 
 
-def _apply_column_widths(worksheet) -> None:
+@lru_cache(maxsize=1)
+def _column_letters() -> tuple[str, ...]:
+    # Computed on first export rather than at import so openpyxl stays lazily loaded.
+    from openpyxl.utils import get_column_letter
+
+    return tuple(get_column_letter(idx) for idx in range(1, len(EXPORT_COLUMNS) + 1))
+
+
+def _apply_column_widths(worksheet, column_widths: list[int]) -> None:
     max_width = 60
     min_width = 12
-    for idx, column_name in enumerate(EXPORT_COLUMNS, start=1):
-        longest = len(column_name)
-        for row_idx in range(2, worksheet.max_row + 1):
-            cell_value = worksheet.cell(row=row_idx, column=idx).value
-            if cell_value is None:
-                continue
-            cell_length = len(str(cell_value))
-            if cell_length > longest:
-                longest = cell_length
-
-        worksheet.column_dimensions[get_column_letter(idx)].width = min(
+    for column_letter, longest in zip(_column_letters(), column_widths):
+        worksheet.column_dimensions[column_letter].width = min(
             max(longest + 2, min_width),
             max_width,
         )
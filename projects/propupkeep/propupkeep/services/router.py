@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import product
+
 from propupkeep.models.issue import IssueCategory, Urgency
 
 
@@ -18,7 +20,20 @@ class IssueRouter:
     _high_priority_recipients = ["Community Manager"]
     _unknown_priority_recipients = ["Leasing Follow-up Desk"]
 
+    def __init__(self) -> None:
+        # Both inputs are small enums, so every routing outcome is computed once up front.
+        self._routes: dict[tuple[IssueCategory, Urgency], tuple[str, ...]] = {
+            (category, urgency): tuple(self._compute_recipients(category, urgency))
+            for category, urgency in product(IssueCategory, Urgency)
+        }
+
     def route_recipients(self, category: IssueCategory, urgency: Urgency) -> list[str]:
+        routed = self._routes.get((category, urgency))
+        if routed is None:
+            return self._compute_recipients(category, urgency)
+        return list(routed)
+
+    def _compute_recipients(self, category: IssueCategory, urgency: Urgency) -> list[str]:
         recipients = list(self._category_defaults.get(category, ["Maintenance Team"]))
         if urgency == Urgency.HIGH:
             recipients.extend(self._high_priority_recipients)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import os
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 from uuid import uuid4
 
+import orjson
+
+from propupkeep.config.settings import get_settings
 from propupkeep.core.logging_utils import get_logger
 
 
@@ -17,7 +19,7 @@ def transcribe_audio(audio_bytes: bytes, mime_type: str) -> str:
     if not audio_bytes:
         raise TranscriptionError("No audio provided for transcription.")
 
-    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    api_key = get_settings().openai_api_key.strip()
     if not api_key:
         raise TranscriptionError("OPENAI_API_KEY is not configured.")
 
@@ -46,7 +48,7 @@ def transcribe_audio(audio_bytes: bytes, mime_type: str) -> str:
 
     try:
         with urlopen(request, timeout=60) as response:
-            payload = response.read().decode("utf-8")
+            payload = response.read()
     except HTTPError as exc:
         response_text = exc.read().decode("utf-8", errors="replace")
         get_logger(__name__).warning(
@@ -62,8 +64,8 @@ def transcribe_audio(audio_bytes: bytes, mime_type: str) -> str:
         raise TranscriptionError("Network error while transcribing audio.") from exc
 
     try:
-        parsed = json.loads(payload)
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(payload)
+    except orjson.JSONDecodeError as exc:
         get_logger(__name__).warning(
             "Voice transcription invalid JSON response",
             extra={"context": {"detail": str(exc)}},
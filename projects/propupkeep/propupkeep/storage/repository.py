@@ -1,22 +1,60 @@
 from __future__ import annotations
 
-import json
+import atexit
+import heapq
+import os
+import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
 
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from propupkeep.core.errors import PersistenceError
 from propupkeep.models.issue import Comment, IssueReport, Status
 
 
+ISSUE_REPORT_LIST_ADAPTER = TypeAdapter(list[IssueReport])
+
+_issue_updated_at = attrgetter("updated_at")
+
+
+def _serialize_issue_entry(issue: IssueReport) -> dict:
+    return {
+        "entry_type": "issue_report",
+        "created_at": issue.created_at.isoformat(),
+        "payload": issue.model_dump(mode="json", exclude_none=False),
+    }
+
+
+def _validate_issue_payloads(payloads: list[dict]) -> list[IssueReport]:
+    # Validate the whole batch in one call; only fall back to per-item validation to skip bad entries.
+    try:
+        return ISSUE_REPORT_LIST_ADAPTER.validate_python(payloads)
+    except ValidationError:
+        issues = []
+        for payload in payloads:
+            try:
+                issues.append(IssueReport.model_validate(payload))
+            except ValidationError:
+                continue
+        return issues
+
+
 class IssueRepository(ABC):
     @abstractmethod
     def save_issue_report(self, report: IssueReport) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_issue_reports(self, reports: list[IssueReport]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def list_recent_activity(self, limit: int = 100) -> list[dict]:
         raise NotImplementedError
@@ -43,23 +81,74 @@ class IssueRepository(ABC):
 
 
 class JsonlIssueRepository(IssueRepository):
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, durable_writes: bool = False) -> None:
         self._file_path = file_path
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._durable_writes = durable_writes
+        # Group commit for durable writes: appends are numbered under _lock, and one fsync outside it
+        # covers every append numbered before it started.
+        self._sync_lock = threading.Lock()
+        self._appended_seq = 0
+        self._synced_seq = 0
+        # Kept open across mutations; reopened when the log is replaced under it.
+        self._append_handle: BinaryIO | None = None
+        self._file_identity: tuple[int, int] | None = None
+        # Entries currently in the file, including superseded revisions of the same issue.
+        self._revision_count = 0
+        # Parsed issues, valid while the file's (mtime_ns, size) still matches what was read or written.
+        self._issues_cache: dict[str, IssueReport] | None = None
+        self._issues_cache_stat: tuple[int, int] | None = None
+        # Byte offset the cache has parsed up to, so lines appended by other processes can be tailed.
+        self._issues_cache_offset = 0
+        self._issues_cache_identity: tuple[int, int] | None = None
+        # Serialized entry per report_id, reused while the cached IssueReport object is unchanged.
+        self._entry_cache: dict[str, tuple[IssueReport, dict]] = {}
+        atexit.register(self.close)
+
+    def warm_up(self) -> None:
+        # Parse the log up front so the first page render doesn't pay for it.
+        with self._lock:
+            self._load_issues_map_unlocked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_append_handle_unlocked()
 
     def save_issue_report(self, report: IssueReport) -> None:
         self.upsert_issue(report)
 
+    def save_issue_reports(self, reports: list[IssueReport]) -> None:
+        if not reports:
+            return
+        # Serialize before taking the lock; one load and one append for the whole batch.
+        entries = [_serialize_issue_entry(report) for report in reports]
+        with self._lock:
+            issues_by_id = self._load_issues_map_unlocked()
+            for report in reports:
+                issues_by_id[report.report_id] = report
+            append_seq = self._append_issues_unlocked(reports, entries, issues_by_id)
+        self._sync_appends(append_seq)
+
     def list_recent_activity(self, limit: int = 100) -> list[dict]:
-        issues = self.list_issues()
-        return [self._serialize_issue_entry(issue) for issue in issues[:limit]]
+        with self._lock:
+            issues = list(self._load_issues_map_unlocked().values())
+            if limit < len(issues) // 4:
+                # Selecting the newest few is O(N log limit) instead of sorting everything.
+                recent_issues = heapq.nlargest(limit, issues, key=_issue_updated_at)
+            else:
+                issues.sort(key=_issue_updated_at, reverse=True)
+                recent_issues = issues[:limit]
+            entries = [self._issue_entry_unlocked(issue) for issue in recent_issues]
+        # Cached entries also feed compaction, so callers get their own entry and payload dicts; a caller
+        # adding or replacing fields can't corrupt the cache for other sessions.
+        return [{**entry, "payload": dict(entry["payload"])} for entry in entries]
 
     def list_issues(self) -> list[IssueReport]:
         with self._lock:
             issues_by_id = self._load_issues_map_unlocked()
         issues = list(issues_by_id.values())
-        issues.sort(key=lambda issue: issue.updated_at, reverse=True)
+        issues.sort(key=_issue_updated_at, reverse=True)
         return issues
 
     def get_issue(self, issue_id: str) -> IssueReport | None:
@@ -68,98 +157,418 @@ class JsonlIssueRepository(IssueRepository):
             return issues_by_id.get(issue_id)
 
     def upsert_issue(self, issue: IssueReport) -> None:
+        entry = _serialize_issue_entry(issue)
         with self._lock:
             issues_by_id = self._load_issues_map_unlocked()
             issues_by_id[issue.report_id] = issue
-            self._rewrite_all_issues_unlocked(issues_by_id)
+            append_seq = self._append_issues_unlocked([issue], [entry], issues_by_id)
+        self._sync_appends(append_seq)
 
     def add_comment(self, issue_id: str, comment: Comment) -> IssueReport:
-        with self._lock:
-            issues_by_id = self._load_issues_map_unlocked()
-            issue = issues_by_id.get(issue_id)
-            if issue is None:
-                raise PersistenceError(f"Issue {issue_id} not found.")
-
-            updated_issue = issue.model_copy(
-                update={
-                    "comments": [*issue.comments, comment],
-                    "updated_at": datetime.now(timezone.utc),
-                }
-            )
-            issues_by_id[issue_id] = updated_issue
-            self._rewrite_all_issues_unlocked(issues_by_id)
-            return updated_issue
+        return self._update_issue(issue_id, lambda issue: {"comments": [*issue.comments, comment]})
 
     def update_status(self, issue_id: str, new_status: Status) -> IssueReport:
-        with self._lock:
-            issues_by_id = self._load_issues_map_unlocked()
-            issue = issues_by_id.get(issue_id)
+        return self._update_issue(issue_id, lambda issue: {"status": new_status})
+
+    def _update_issue(self, issue_id: str, build_update: Callable[[IssueReport], dict]) -> IssueReport:
+        while True:
+            with self._lock:
+                issue = self._load_issues_map_unlocked().get(issue_id)
             if issue is None:
                 raise PersistenceError(f"Issue {issue_id} not found.")
 
+            # Copy and serialize outside the lock, then only commit if nobody replaced the issue meanwhile.
             updated_issue = issue.model_copy(
-                update={
-                    "status": new_status,
-                    "updated_at": datetime.now(timezone.utc),
-                }
+                update={**build_update(issue), "updated_at": datetime.now(timezone.utc)}
             )
-            issues_by_id[issue_id] = updated_issue
-            self._rewrite_all_issues_unlocked(issues_by_id)
+            entry = _serialize_issue_entry(updated_issue)
+            with self._lock:
+                issues_by_id = self._load_issues_map_unlocked()
+                if issues_by_id.get(issue_id) is not issue:
+                    continue
+                issues_by_id[issue_id] = updated_issue
+                append_seq = self._append_issues_unlocked([updated_issue], [entry], issues_by_id)
+            self._sync_appends(append_seq)
             return updated_issue
 
     def _load_issues_map_unlocked(self) -> dict[str, IssueReport]:
+        try:
+            file_stat = self._file_path.stat()
+        except FileNotFoundError:
+            self._issues_cache = None
+            self._file_identity = None
+            self._revision_count = 0
+            return {}
+        except OSError as exc:
+            raise PersistenceError(
+                "Unable to read local activity log.",
+                detail=str(exc),
+            ) from exc
+        self._file_identity = (file_stat.st_dev, file_stat.st_ino)
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._issues_cache is not None and stat_key == self._issues_cache_stat:
+            return self._issues_cache
+        if (
+            self._issues_cache is not None
+            and self._file_identity == self._issues_cache_identity
+            and file_stat.st_size > self._issues_cache_offset
+        ):
+            # Same file, only grown: another writer appended, so parse just the new bytes.
+            return self._load_appended_issues_unlocked(file_stat, stat_key)
+
+        try:
+            raw_log = self._file_path.read_bytes()
+        except OSError as exc:
+            raise PersistenceError(
+                "Unable to read local activity log.",
+                detail=str(exc),
+            ) from exc
+
         issues_by_id: dict[str, IssueReport] = {}
-        if not self._file_path.exists():
-            return issues_by_id
+        issues = self._parse_issue_lines(raw_log)
+        for issue in issues:
+            # Later lines are newer revisions of the same issue, so the last one wins.
+            issues_by_id[issue.report_id] = issue
+        self._revision_count = len(issues)
+
+        self._issues_cache = issues_by_id
+        self._issues_cache_stat = stat_key
+        self._issues_cache_offset = len(raw_log)
+        self._issues_cache_identity = self._file_identity
+        return issues_by_id
 
+    def _load_appended_issues_unlocked(
+        self,
+        file_stat: os.stat_result,
+        stat_key: tuple[int, int],
+    ) -> dict[str, IssueReport]:
         try:
-            with self._file_path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    payload = None
-                    if isinstance(entry, dict) and entry.get("entry_type") == "issue_report":
-                        payload = entry.get("payload")
-                    elif isinstance(entry, dict):
-                        payload = entry
-
-                    if not isinstance(payload, dict):
-                        continue
-
-                    try:
-                        issue = IssueReport.model_validate(payload)
-                    except ValidationError:
-                        continue
-                    issues_by_id[issue.report_id] = issue
+            with self._file_path.open("rb") as handle:
+                handle.seek(self._issues_cache_offset)
+                appended = handle.read(file_stat.st_size - self._issues_cache_offset)
         except OSError as exc:
             raise PersistenceError(
                 "Unable to read local activity log.",
                 detail=str(exc),
             ) from exc
+
+        # A writer may be mid-line; leave the unterminated tail for the next load.
+        consumed = appended.rfind(b"\n") + 1
+        issues = self._parse_issue_lines(appended[:consumed])
+        issues_by_id = self._issues_cache
+        for issue in issues:
+            issues_by_id[issue.report_id] = issue
+        self._revision_count += len(issues)
+
+        self._issues_cache_stat = stat_key
+        self._issues_cache_offset += consumed
         return issues_by_id
 
+    @staticmethod
+    def _parse_issue_lines(raw_log: bytes) -> list[IssueReport]:
+        payloads: list[dict] = []
+        # One read plus a C-level split is cheaper than buffered per-line iteration.
+        for line in raw_log.split(b"\n"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+
+            payload = None
+            if isinstance(entry, dict) and entry.get("entry_type") == "issue_report":
+                payload = entry.get("payload")
+            elif isinstance(entry, dict):
+                payload = entry
+
+            if not isinstance(payload, dict):
+                continue
+            payloads.append(payload)
+
+        return _validate_issue_payloads(payloads)
+
+    def _append_issues_unlocked(
+        self,
+        issues: list[IssueReport],
+        entries: list[dict],
+        issues_by_id: dict[str, IssueReport],
+    ) -> int:
+        for issue, entry in zip(issues, entries):
+            self._entry_cache[issue.report_id] = (issue, entry)
+        try:
+            handle = self._append_handle_unlocked()
+            before_stat = os.fstat(handle.fileno())
+            # Only keep the cache if nobody else wrote to the file since it was loaded.
+            cache_is_current = (before_stat.st_mtime_ns, before_stat.st_size) == self._issues_cache_stat
+            handle.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
+            handle.flush()
+            self._remember_written_issues_unlocked(
+                issues_by_id if cache_is_current else None,
+                os.fstat(handle.fileno()),
+            )
+        except OSError as exc:
+            self._issues_cache = None
+            self._close_append_handle_unlocked()
+            raise PersistenceError(
+                "Unable to persist activity locally.",
+                detail=str(exc),
+            ) from exc
+        self._revision_count += len(issues)
+
+        # Compact once superseded revisions outnumber live issues.
+        if self._revision_count > 2 * len(issues_by_id):
+            self._rewrite_all_issues_unlocked(issues_by_id)
+
+        # Durable writes are fsynced by _sync_appends once the caller releases the lock.
+        if not self._durable_writes:
+            return 0
+        self._appended_seq += 1
+        return self._appended_seq
+
+    def _sync_appends(self, append_seq: int) -> None:
+        if not append_seq:
+            return
+        with self._sync_lock:
+            # A sync that started after this append was written already covered it.
+            if self._synced_seq >= append_seq:
+                return
+            with self._lock:
+                target_seq = self._appended_seq
+                handle = self._append_handle
+                # No open handle means a compaction closed it after writing and syncing every entry.
+                sync_fd = os.dup(handle.fileno()) if handle is not None else None
+            if sync_fd is not None:
+                try:
+                    os.fsync(sync_fd)
+                except OSError as exc:
+                    raise PersistenceError(
+                        "Unable to persist activity locally.",
+                        detail=str(exc),
+                    ) from exc
+                finally:
+                    os.close(sync_fd)
+            self._synced_seq = target_seq
+
     def _rewrite_all_issues_unlocked(self, issues_by_id: dict[str, IssueReport]) -> None:
+        self._close_append_handle_unlocked()
+        temp_path = self._file_path.with_name(f"{self._file_path.name}.tmp")
         try:
             ordered_issues = sorted(issues_by_id.values(), key=lambda issue: issue.created_at)
-            with self._file_path.open("w", encoding="utf-8") as handle:
-                for issue in ordered_issues:
-                    handle.write(json.dumps(self._serialize_issue_entry(issue), ensure_ascii=True))
-                    handle.write("\n")
+            with temp_path.open("wb") as handle:
+                handle.write(
+                    b"".join(orjson.dumps(self._issue_entry_unlocked(issue)) + b"\n" for issue in ordered_issues)
+                )
+                handle.flush()
+                # Compaction is rare and replaces every entry, so the new file is always synced before it
+                # takes the old one's place; otherwise a crash could leave an empty log behind the rename.
+                os.fsync(handle.fileno())
+                written_stat = os.fstat(handle.fileno())
+            # Readers see either the old log or the compacted one, never a half-written file.
+            os.replace(temp_path, self._file_path)
+            self._remember_written_issues_unlocked(issues_by_id, written_stat)
         except OSError as exc:
+            self._issues_cache = None
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            raise PersistenceError(
+                "Unable to persist activity locally.",
+                detail=str(exc),
+            ) from exc
+        self._revision_count = len(issues_by_id)
+
+    def _append_handle_unlocked(self) -> BinaryIO:
+        handle = self._append_handle
+        if handle is not None:
+            handle_stat = os.fstat(handle.fileno())
+            if (handle_stat.st_dev, handle_stat.st_ino) == self._file_identity:
+                return handle
+            # The log was replaced or removed since the handle was opened, e.g. compacted elsewhere.
+            handle.close()
+        handle = self._file_path.open("ab", buffering=64 * 1024)
+        self._append_handle = handle
+        return handle
+
+    def _close_append_handle_unlocked(self) -> None:
+        if self._append_handle is not None:
+            try:
+                self._append_handle.close()
+            except OSError:
+                pass
+            self._append_handle = None
+
+    def _remember_written_issues_unlocked(
+        self,
+        issues_by_id: dict[str, IssueReport] | None,
+        file_stat: os.stat_result,
+    ) -> None:
+        # Lets the next load skip re-reading what this process just wrote.
+        self._issues_cache = issues_by_id
+        self._issues_cache_stat = (file_stat.st_mtime_ns, file_stat.st_size)
+        self._issues_cache_offset = file_stat.st_size
+        self._issues_cache_identity = (file_stat.st_dev, file_stat.st_ino)
+
+    def _issue_entry_unlocked(self, issue: IssueReport) -> dict:
+        # Issues are replaced via model_copy on every change, so identity means "unchanged".
+        cached = self._entry_cache.get(issue.report_id)
+        if cached is not None and cached[0] is issue:
+            return cached[1]
+        entry = _serialize_issue_entry(issue)
+        self._entry_cache[issue.report_id] = (issue, entry)
+        return entry
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    report_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    entry BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_updated_at ON issues (updated_at DESC);
+"""
+_SQLITE_UPSERT = (
+    "INSERT INTO issues (report_id, updated_at, entry) VALUES (?, ?, ?) "
+    "ON CONFLICT(report_id) DO UPDATE SET updated_at = excluded.updated_at, entry = excluded.entry"
+)
+
+
+class SqliteIssueRepository(IssueRepository):
+    """Current issue state in a WAL-mode SQLite database, one row per issue."""
+
+    _busy_timeout_seconds = 5.0
+
+    def __init__(self, file_path: Path, durable_writes: bool = False) -> None:
+        self._file_path = file_path
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._durable_writes = durable_writes
+        # One connection per repository, serialized by _lock; other processes coordinate through SQLite's
+        # own locking, and WAL lets their reads proceed during a write.
+        self._connection: sqlite3.Connection | None = None
+        atexit.register(self.close)
+
+    def warm_up(self) -> None:
+        # Open the database and create the schema up front so the first page render doesn't pay for it.
+        with self._lock:
+            self._read_unlocked("SELECT 1")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.close()
+                except sqlite3.Error:
+                    pass
+                self._connection = None
+
+    def save_issue_report(self, report: IssueReport) -> None:
+        self.upsert_issue(report)
+
+    def save_issue_reports(self, reports: list[IssueReport]) -> None:
+        if not reports:
+            return
+        rows = [self._issue_row(report) for report in reports]
+        with self._lock, self._write_transaction_unlocked() as connection:
+            connection.executemany(_SQLITE_UPSERT, rows)
+
+    def list_recent_activity(self, limit: int = 100) -> list[dict]:
+        with self._lock:
+            rows = self._read_unlocked("SELECT entry FROM issues ORDER BY updated_at DESC LIMIT ?", (limit,))
+        return [orjson.loads(entry) for (entry,) in rows]
+
+    def list_issues(self) -> list[IssueReport]:
+        with self._lock:
+            rows = self._read_unlocked("SELECT entry FROM issues ORDER BY updated_at DESC")
+        return self._issues_from_rows(rows)
+
+    def get_issue(self, issue_id: str) -> IssueReport | None:
+        with self._lock:
+            rows = self._read_unlocked("SELECT entry FROM issues WHERE report_id = ?", (issue_id,))
+        issues = self._issues_from_rows(rows)
+        return issues[0] if issues else None
+
+    def upsert_issue(self, issue: IssueReport) -> None:
+        row = self._issue_row(issue)
+        with self._lock, self._write_transaction_unlocked() as connection:
+            connection.execute(_SQLITE_UPSERT, row)
+
+    def add_comment(self, issue_id: str, comment: Comment) -> IssueReport:
+        return self._update_issue(issue_id, lambda issue: {"comments": [*issue.comments, comment]})
+
+    def update_status(self, issue_id: str, new_status: Status) -> IssueReport:
+        return self._update_issue(issue_id, lambda issue: {"status": new_status})
+
+    def _update_issue(self, issue_id: str, build_update: Callable[[IssueReport], dict]) -> IssueReport:
+        # The read and the write share one IMMEDIATE transaction, so no other writer can slip in between.
+        with self._lock, self._write_transaction_unlocked() as connection:
+            rows = connection.execute("SELECT entry FROM issues WHERE report_id = ?", (issue_id,)).fetchall()
+            issues = self._issues_from_rows(rows)
+            if not issues:
+                raise PersistenceError(f"Issue {issue_id} not found.")
+            issue = issues[0]
+            updated_issue = issue.model_copy(
+                update={**build_update(issue), "updated_at": datetime.now(timezone.utc)}
+            )
+            connection.execute(_SQLITE_UPSERT, self._issue_row(updated_issue))
+        return updated_issue
+
+    def _connection_unlocked(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self._file_path,
+                timeout=self._busy_timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                # NORMAL only syncs at checkpoints in WAL mode; FULL syncs every commit.
+                connection.execute(f"PRAGMA synchronous={'FULL' if self._durable_writes else 'NORMAL'}")
+                connection.executescript(_SQLITE_SCHEMA)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _read_unlocked(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        try:
+            return self._connection_unlocked().execute(sql, parameters).fetchall()
+        except sqlite3.Error as exc:
+            raise PersistenceError(
+                "Unable to read local activity log.",
+                detail=str(exc),
+            ) from exc
+
+    @contextmanager
+    def _write_transaction_unlocked(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._connection_unlocked()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as exc:
             raise PersistenceError(
                 "Unable to persist activity locally.",
                 detail=str(exc),
             ) from exc
 
-    def _serialize_issue_entry(self, issue: IssueReport) -> dict:
-        return {
-            "entry_type": "issue_report",
-            "created_at": issue.created_at.isoformat(),
-            "payload": issue.model_dump(mode="json", exclude_none=False),
-        }
+    @staticmethod
+    def _issue_row(issue: IssueReport) -> tuple[str, float, bytes]:
+        return (issue.report_id, issue.updated_at.timestamp(), orjson.dumps(_serialize_issue_entry(issue)))
+
+    @staticmethod
+    def _issues_from_rows(rows: list[tuple]) -> list[IssueReport]:
+        payloads = []
+        for (entry,) in rows:
+            payload = orjson.loads(entry).get("payload")
+            if isinstance(payload, dict):
+                payloads.append(payload)
+        return _validate_issue_payloads(payloads)
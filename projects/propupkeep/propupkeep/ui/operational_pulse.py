@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from datetime import date, timedelta, timezone
 from typing import Any
 
+import orjson
 import pandas as pd
 import streamlit as st
 
@@ -87,7 +87,7 @@ def _record_to_json(record: Any) -> str:
         payload = record.model_dump(mode="json")
     else:
         payload = {}
-    return json.dumps(payload, ensure_ascii=True, sort_keys=True, default=str)
+    return orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 @st.cache_data(show_spinner=False)
@@ -95,8 +95,8 @@ def _normalize_records_to_df(records_json: tuple[str, ...]) -> pd.DataFrame:
     rows: list[dict[str, Any]] = []
     for raw_record in records_json:
         try:
-            payload = json.loads(raw_record)
-        except json.JSONDecodeError:
+            payload = orjson.loads(raw_record)
+        except orjson.JSONDecodeError:
             continue
         if not isinstance(payload, dict):
             continue
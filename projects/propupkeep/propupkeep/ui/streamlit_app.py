@@ -1,24 +1,33 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from html import escape
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 from uuid import uuid4
 
+import pandas as pd
 import streamlit as st
+from PIL import Image, ImageOps, UnidentifiedImageError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from propupkeep.ai.formatter import OpenAIIssueFormatter
 from propupkeep.config.settings import Settings, get_settings
 from propupkeep.core.errors import UserVisibleError
 from propupkeep.core.logging_utils import configure_logging, get_logger
-from propupkeep.core.workflows import IssueWorkflowService
+from propupkeep.core.sanitize import IMAGE_SIGNATURE_BYTES, sniff_image_mime
 from propupkeep.models.issue import COMMENT_AUTHOR_ROLES, IssueMetadata, IssueReport, IssueSource, Status
 from propupkeep.services.exporter import export_issues_to_excel_bytes
-from propupkeep.services.router import IssueRouter
 from propupkeep.services.transcription import TranscriptionError, transcribe_audio
-from propupkeep.storage.repository import JsonlIssueRepository
 from propupkeep.ui.operational_pulse import render_operational_pulse
 
+if TYPE_CHECKING:
+    from propupkeep.core.workflows import IssueWorkflowService
+
 try:
     from audio_recorder_streamlit import audio_recorder
 
@@ -28,6 +37,72 @@ except Exception:  # noqa: BLE001
     AUDIO_RECORDER_AVAILABLE = False
 
 
+# Rendered at 160px wide; 2x covers high-DPI screens.
+_FEED_THUMBNAIL_SIZE = (320, 320)
+_FEED_THUMBNAIL_WORKERS = 8
+_MAX_FEED_DETAIL_CARDS = 10
+_FEED_PAGE_SIZE = 20
+
+_URGENCY_RANKS = {
+    "emergency": 4,
+    "high": 3,
+    "medium": 2,
+    "low": 1,
+    "unknown": 0,
+}
+
+_STATUS_OPTIONS = tuple(status.value for status in Status)
+_STATUS_OPTION_INDEX = {status: idx for idx, status in enumerate(_STATUS_OPTIONS)}
+_STATUS_PALETTE = {
+    Status.OPEN.value: ("#1f2937", "#e5e7eb"),
+    Status.ACKNOWLEDGED.value: ("#1d4ed8", "#dbeafe"),
+    Status.IN_PROGRESS.value: ("#92400e", "#fef3c7"),
+    Status.MONITORING.value: ("#4338ca", "#e0e7ff"),
+    Status.RESOLVED.value: ("#166534", "#dcfce7"),
+}
+_COMMENT_ROLE_OPTIONS = tuple(COMMENT_AUTHOR_ROLES)
+_SOURCE_ALIASES = {
+    "quick_snap": IssueSource.QUICK_SNAP.value,
+    "quick snap": IssueSource.QUICK_SNAP.value,
+    "photo": IssueSource.QUICK_SNAP.value,
+    "unit_notes": IssueSource.UNIT_NOTES.value,
+    "unit notes": IssueSource.UNIT_NOTES.value,
+    "note": IssueSource.UNIT_NOTES.value,
+    "quick_voice": IssueSource.QUICK_VOICE.value,
+    "quick voice": IssueSource.QUICK_VOICE.value,
+    "voice": IssueSource.QUICK_VOICE.value,
+    "unknown": IssueSource.UNKNOWN.value,
+    "": IssueSource.UNKNOWN.value,
+}
+
+_PROPERTY_OPTIONS = ("Oak Ridge Apartments", "Maple Court Homes", "Riverstone Commons")
+_BUILDING_OPTIONS = ("Building A", "Building B", "Building C", "Townhomes")
+_UNIT_OPTIONS = ("101", "102", "103", "104", "201", "202", "203", "204")
+_AREA_OPTIONS = (
+    "Unknown",
+    "Kitchen",
+    "Bathroom",
+    "Living Room",
+    "Bedroom",
+    "Laundry",
+    "Exterior",
+    "Hallway",
+    "Other",
+)
+_FEED_SOURCE_FILTERS = {
+    "Quick Snap": IssueSource.QUICK_SNAP.value,
+    "Unit Notes": IssueSource.UNIT_NOTES.value,
+    "Quick Voice": IssueSource.QUICK_VOICE.value,
+}
+_FEED_SOURCE_FILTER_OPTIONS = ("All", *_FEED_SOURCE_FILTERS)
+_FEED_SORT_OPTIONS = (
+    "Date (Newest)",
+    "Date (Oldest)",
+    "Urgency (High->Low)",
+    "Urgency (Low->High)",
+)
+
+
 def _render_base_styles() -> None:
     st.markdown(
         """
@@ -67,11 +142,23 @@ def _render_base_styles() -> None:
 
 @st.cache_resource
 def _build_workflow() -> tuple[Settings, IssueWorkflowService]:
+    # Imported here so loading this module doesn't pay for httpx and the service layer; the
+    # cache_resource wrapper means this body runs once per process.
+    from propupkeep.ai.formatter import OpenAIIssueFormatter
+    from propupkeep.core.workflows import IssueWorkflowService
+    from propupkeep.services.router import IssueRouter
+    from propupkeep.storage.repository import JsonlIssueRepository, SqliteIssueRepository
+
     settings = get_settings()
     configure_logging(settings.log_level)
 
-    repository = JsonlIssueRepository(settings.data_file)
+    if settings.storage_backend == "sqlite":
+        repository = SqliteIssueRepository(settings.sqlite_file, durable_writes=settings.durable_writes)
+    else:
+        repository = JsonlIssueRepository(settings.data_file, durable_writes=settings.durable_writes)
+    repository.warm_up()
     formatter = OpenAIIssueFormatter(settings=settings)
+    formatter.warm_up()
     router = IssueRouter()
     workflow = IssueWorkflowService(
         formatter=formatter,
@@ -86,21 +173,131 @@ def _build_workflow() -> tuple[Settings, IssueWorkflowService]:
 
 
 @st.cache_data(show_spinner=False, ttl=20)
-def _load_issue_payloads(_workflow: IssueWorkflowService, limit: int = 100) -> list[dict]:
+def _load_issue_payloads(
+    _workflow: IssueWorkflowService,
+    limit: int = 100,
+    data_version: tuple[int, int] = (0, 0),
+) -> list[dict]:
+    # data_version only participates in the cache key, so a changed log invalidates the entry at once.
     issues = _workflow.list_issues(limit=limit)
     return [issue.model_dump(mode="json") for issue in issues]
 
 
-def _hydrate_issues(issue_payloads: list[dict]) -> list[IssueReport]:
-    hydrated: list[IssueReport] = []
-    for payload in issue_payloads:
+@st.cache_resource(show_spinner=False, ttl=20, max_entries=4)
+def _load_feed_issues(
+    _workflow: IssueWorkflowService,
+    limit: int = 100,
+    data_version: tuple[int, int] = (0, 0),
+) -> list[IssueReport]:
+    # The feed works on IssueReport objects, so share them instead of dumping to dicts for cache_data
+    # and re-validating on every rerun. Issues are only ever replaced via model_copy, never mutated,
+    # and callers must not mutate the returned list.
+    return _workflow.list_issues(limit=limit)
+
+
+def _data_file_version(data_file: Path) -> tuple[int, int]:
+    # Size as well as mtime, so writes within the filesystem's timestamp granularity still count. A SQLite
+    # store commits into its -wal file first, so that file counts too when present.
+    mtime_ns = size = 0
+    for path in (data_file, data_file.with_name(f"{data_file.name}-wal")):
         try:
-            hydrated.append(IssueReport.model_validate(payload))
-        except Exception:  # noqa: BLE001
+            file_stat = path.stat()
+        except OSError:
             continue
-    return hydrated
+        mtime_ns = max(mtime_ns, file_stat.st_mtime_ns)
+        size += file_stat.st_size
+    return (mtime_ns, size)
+
+
+@st.cache_data(show_spinner=False, ttl=20)
+def _feed_category_options(_issues: list[IssueReport], data_version: tuple[int, int]) -> list[str]:
+    # Keyed like _load_issue_payloads, so filter/sort reruns skip the scan until the log changes.
+    return sorted(
+        {
+            str(issue.category.value).strip()
+            for issue in _issues
+            if str(issue.category.value).strip()
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _filtered_issue_indices(
+    _issues: list[IssueReport],
+    category_filter: str,
+    source_filter: str,
+    sort_by: str,
+    data_version: tuple[int, int],
+) -> list[int]:
+    # Positions into _issues, so the cached value stays small and the caller keeps its own objects.
+    selected_source = _FEED_SOURCE_FILTERS.get(source_filter) if source_filter != "All" else None
+    sort_key = _issue_urgency_sort_key if sort_by.startswith("Urgency") else _issue_date_sort_key
+    # One filtering pass feeding a single sort, instead of a new list per filter and per branch.
+    return sorted(
+        (
+            issue_idx
+            for issue_idx, issue in enumerate(_issues)
+            if _matches_feed_filters(issue, category_filter, selected_source)
+        ),
+        key=lambda issue_idx: sort_key(_issues[issue_idx]),
+        reverse=sort_by in {"Date (Newest)", "Urgency (High->Low)"},
+    )
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _feed_table(
+    _filtered_issues: list[IssueReport],
+    project_root: Path,
+    category_filter: str,
+    source_filter: str,
+    sort_by: str,
+    row_limit: int,
+    data_version: tuple[int, int],
+) -> pd.DataFrame:
+    # Keyed like _filtered_issue_indices, so reruns reuse the projected rows and their thumbnail data URIs
+    # instead of rebuilding them. Stored images are write-once, named after their report.
+    thumbnails = _feed_thumbnails(
+        project_root,
+        # Thumbnail per stored path, so repeated paths cost one resolve + stat.
+        list(dict.fromkeys(str(issue.image_path) for issue in _filtered_issues if issue.image_path)),
+    )
+    return pd.DataFrame(
+        [
+            {
+                "photo": _thumbnail_data_uri(thumbnails[str(issue.image_path)]) if issue.image_path else None,
+                "created": _format_ts(issue.created_at),
+                "status": issue.status.value,
+                "urgency": issue.urgency.value,
+                "category": issue.category.value,
+                "issue": issue.issue,
+                "location": (
+                    f"{issue.property_name} · {issue.building} · Unit {issue.unit_number}"
+                    f" · {issue.area or 'Unknown'}"
+                ),
+                "source": _source_label(getattr(issue, "source", None)),
+                "recipients": ", ".join(issue.recipients) if issue.recipients else "Unassigned",
+                "comments": len(issue.comments),
+            }
+            for issue in _filtered_issues
+        ]
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _feed_export_bytes(
+    _filtered_issues: list[IssueReport],
+    category_filter: str,
+    source_filter: str,
+    sort_by: str,
+    data_version: tuple[int, int],
+) -> bytes:
+    # Same key as _filtered_issue_indices: the workbook is only rebuilt when the rows it would contain change.
+    return export_issues_to_excel_bytes(_filtered_issues)
+
+
+# Pure function of its input (given the process's local timezone), and the feed formats the same
+# timestamps on every rerun.
+@lru_cache(maxsize=4096)
 def _format_ts(value: str | datetime | None) -> str:
     try:
         if isinstance(value, datetime):
@@ -115,6 +312,8 @@ def _format_ts(value: str | datetime | None) -> str:
         return str(value or "")
 
 
+# Comment histories and the feed sort parse the same timestamps on every rerun.
+@lru_cache(maxsize=4096)
 def _date_sort_value(value: str | datetime | None) -> float:
     if not value:
         return float("-inf")
@@ -133,41 +332,46 @@ def _date_sort_value(value: str | datetime | None) -> float:
         return float("-inf")
 
 
+# Urgency values come from a handful of labels, so the normalized rank is memoized.
+@lru_cache(maxsize=16)
 def _urgency_rank(value: str | None) -> int:
-    ranking = {
-        "emergency": 4,
-        "high": 3,
-        "medium": 2,
-        "low": 1,
-        "unknown": 0,
-    }
     normalized = (value or "").strip().lower()
-    return ranking.get(normalized, 0)
+    return _URGENCY_RANKS.get(normalized, 0)
 
 
 def _is_maintenance_routed(recipients: list[str] | None) -> bool:
     if not recipients:
         return False
-    return any("maintenance" in str(item).lower() for item in recipients)
+    return any(_is_maintenance_recipient(str(item)) for item in recipients)
+
+
+# Recipients come from the router's short list of team names, so each one is lowercased and scanned once.
+@lru_cache(maxsize=256)
+def _is_maintenance_recipient(recipient: str) -> bool:
+    return "maintenance" in recipient.lower()
+
+
+def _matches_feed_filters(issue: IssueReport, category_filter: str, selected_source: str | None) -> bool:
+    if category_filter == "Maintenance View":
+        if not _is_maintenance_routed(issue.recipients):
+            return False
+    elif category_filter != "All" and str(issue.category.value).strip() != category_filter:
+        return False
+    return selected_source is None or _normalize_source_value(getattr(issue, "source", None)) == selected_source
+
+
+def _issue_date_sort_key(issue: IssueReport) -> float:
+    return _date_sort_value(issue.created_at)
+
+
+def _issue_urgency_sort_key(issue: IssueReport) -> tuple[int, float]:
+    return (_urgency_rank(issue.urgency.value), _date_sort_value(issue.created_at))
 
 
 def _normalize_source_value(value: IssueSource | str | None) -> str:
     raw = value.value if isinstance(value, IssueSource) else str(value or "")
     normalized = raw.strip().lower()
-    source_map = {
-        "quick_snap": IssueSource.QUICK_SNAP.value,
-        "quick snap": IssueSource.QUICK_SNAP.value,
-        "photo": IssueSource.QUICK_SNAP.value,
-        "unit_notes": IssueSource.UNIT_NOTES.value,
-        "unit notes": IssueSource.UNIT_NOTES.value,
-        "note": IssueSource.UNIT_NOTES.value,
-        "quick_voice": IssueSource.QUICK_VOICE.value,
-        "quick voice": IssueSource.QUICK_VOICE.value,
-        "voice": IssueSource.QUICK_VOICE.value,
-        "unknown": IssueSource.UNKNOWN.value,
-        "": IssueSource.UNKNOWN.value,
-    }
-    return source_map.get(normalized, IssueSource.UNKNOWN.value)
+    return _SOURCE_ALIASES.get(normalized, IssueSource.UNKNOWN.value)
 
 
 def _source_label(value: IssueSource | str | None) -> str:
@@ -180,15 +384,9 @@ def _source_label(value: IssueSource | str | None) -> str:
     return labels.get(_normalize_source_value(value), "Unknown")
 
 
+@lru_cache(maxsize=16)
 def _status_badge_html(status: str) -> str:
-    palette = {
-        Status.OPEN.value: ("#1f2937", "#e5e7eb"),
-        Status.ACKNOWLEDGED.value: ("#1d4ed8", "#dbeafe"),
-        Status.IN_PROGRESS.value: ("#92400e", "#fef3c7"),
-        Status.MONITORING.value: ("#4338ca", "#e0e7ff"),
-        Status.RESOLVED.value: ("#166534", "#dcfce7"),
-    }
-    text_color, bg_color = palette.get(status, ("#1f2937", "#e5e7eb"))
+    text_color, bg_color = _STATUS_PALETTE.get(status, ("#1f2937", "#e5e7eb"))
     return (
         "<span style='display:inline-block;padding:0.2rem 0.55rem;border-radius:999px;"
         f"font-size:0.78rem;font-weight:600;color:{text_color};background:{bg_color};'>"
@@ -196,19 +394,74 @@ def _status_badge_html(status: str) -> str:
     )
 
 
+@lru_cache(maxsize=1)
+def _resolved_project_root(project_root: Path) -> Path:
+    # The project root never changes for the life of the app; resolve it once.
+    return project_root.resolve()
+
+
+# Stored image paths never change once written, so their resolution is reused across reruns; the
+# existence check stays live in _feed_thumbnail.
+@lru_cache(maxsize=1024)
 def _resolve_image_path(project_root: Path, image_path: str) -> Path | None:
+    root = _resolved_project_root(project_root)
     try:
         raw_path = Path(image_path)
-        resolved = raw_path.resolve() if raw_path.is_absolute() else (project_root / raw_path).resolve()
+        resolved = raw_path.resolve() if raw_path.is_absolute() else (root / raw_path).resolve()
     except OSError:
         return None
 
-    root = project_root.resolve()
     if resolved != root and root not in resolved.parents:
         return None
     return resolved
 
 
+def _feed_thumbnails(project_root: Path, image_paths: list[str]) -> dict[str, bytes | None]:
+    if len(image_paths) <= 1:
+        return {image_path: _feed_thumbnail(project_root, image_path) for image_path in image_paths}
+    # Pillow releases the GIL while decoding, resizing and encoding, so cold thumbnails build in parallel.
+    # Workers carry the script run context so the cache_data lookups behave as on the main thread.
+    with ThreadPoolExecutor(
+        max_workers=min(_FEED_THUMBNAIL_WORKERS, len(image_paths)),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        thumbnails = executor.map(partial(_feed_thumbnail, project_root), image_paths)
+        return dict(zip(image_paths, thumbnails))
+
+
+def _feed_thumbnail(project_root: Path, image_path: str) -> bytes | None:
+    resolved_path = _resolve_image_path(project_root, image_path)
+    if resolved_path is None:
+        return None
+    try:
+        mtime_ns = resolved_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _thumbnail_bytes(str(resolved_path), mtime_ns)
+
+
+@st.cache_data(show_spinner=False, max_entries=500, persist="disk")
+def _thumbnail_bytes(path: str, mtime_ns: int) -> bytes | None:
+    # mtime_ns only keys the cache so a replaced file gets a fresh thumbnail. Persisted to disk so a
+    # restarted app doesn't decode every original again.
+    try:
+        with Image.open(path) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(_FEED_THUMBNAIL_SIZE)
+            output = BytesIO()
+            image.convert("RGB").save(output, format="JPEG", quality=75)
+    except (OSError, UnidentifiedImageError):
+        return None
+    return output.getvalue()
+
+
+def _thumbnail_data_uri(thumbnail: bytes | None) -> str | None:
+    if not thumbnail:
+        return None
+    return f"data:image/jpeg;base64,{base64.b64encode(thumbnail).decode('ascii')}"
+
+
 def _ensure_voice_state() -> None:
     defaults: dict[str, object] = {
         "voice_audio_bytes": b"",
@@ -238,48 +491,324 @@ def _clear_voice_state() -> None:
     st.session_state["voice_recorder_nonce"] = int(st.session_state.get("voice_recorder_nonce", 0)) + 1
 
 
-def _render_structured_report(report: dict, heading: str = "Structured Report") -> None:
-    st.markdown(f"### {heading}")
-    st.markdown(f"**Source**\n\n{report.get('source', 'unknown')}")
-    st.markdown(f"**Reported Observation (verbatim style)**\n\n{report.get('reported_observation', '')}")
-    st.markdown(f"**Issue**\n\n{report.get('issue', '')}")
-    st.markdown(f"**Urgency**\n\n{report.get('urgency', '')}")
-    st.markdown(f"**Category**\n\n{report.get('category', '')}")
-    st.markdown(f"**Recommended Action**\n\n{report.get('recommended_action', '')}")
+def _structured_report_markdown(report: IssueReport, heading: str = "Structured Report") -> str:
+    # Built once when a report is submitted, straight from the model; reruns re-send the stored string
+    # as one markdown element.
+    confidence = report.confidence
+    sections = [
+        f"### {heading}",
+        f"**Source**\n\n{report.source.value}",
+        f"**Reported Observation (verbatim style)**\n\n{report.reported_observation}",
+        f"**Issue**\n\n{report.issue}",
+        f"**Urgency**\n\n{report.urgency.value}",
+        f"**Category**\n\n{report.category.value}",
+        f"**Recommended Action**\n\n{report.recommended_action}",
+        (
+            "**Confidence**\n\n"
+            f"- Category: {confidence.category}\n"
+            f"- Urgency: {confidence.urgency}"
+        ),
+    ]
+
+    if report.recipients:
+        sections.append(f"**Routing Recipients**\n\n{', '.join(report.recipients)}")
+
+    entity_lines = [f"- {key}: {', '.join(values)}" for key, values in report.extracted_entities if values]
+    if entity_lines:
+        sections.append("**Extracted Entities**\n\n" + "\n".join(entity_lines))
+
+    if report.photo_observation:
+        sections.append(f"**Photo Observation**\n\n{report.photo_observation}")
+
+    if report.needs_followup:
+        questions = report.followup_questions
+        if questions:
+            sections.append("**Follow-up Questions Needed**\n\n" + "\n".join(f"- {q}" for q in questions))
+        else:
+            sections.append("**Follow-up Questions Needed**\n\n- Please provide additional details.")
 
-    confidence = report.get("confidence") or {}
-    st.markdown(
-        "**Confidence**\n\n"
-        f"- Category: {confidence.get('category', 'n/a')}\n"
-        f"- Urgency: {confidence.get('urgency', 'n/a')}"
+    if report.image_filename:
+        sections.append(f"**Image Filename**\n\n{report.image_filename}")
+
+    return "\n\n".join(sections)
+
+
+def _prefetch_unit_note(workflow: IssueWorkflowService, build_metadata: Callable[[], IssueMetadata]) -> None:
+    # Fires when the note loses focus, so "Format for Team" usually finds the brief in flight or cached.
+    try:
+        workflow.prefetch_issue(
+            source=IssueSource.UNIT_NOTES,
+            note_text=st.session_state.get("unit_note_text", ""),
+            metadata=build_metadata(),
+        )
+    except Exception as exc:  # noqa: BLE001
+        get_logger(__name__).info("Unit note prefetch skipped", extra={"context": {"error": str(exc)}})
+
+
+def _load_more_feed_rows() -> None:
+    st.session_state["feed_row_limit"] = (
+        st.session_state.get("feed_row_limit", _FEED_PAGE_SIZE) + _FEED_PAGE_SIZE
     )
 
-    recipients = report.get("recipients", [])
-    if recipients:
-        st.markdown(f"**Routing Recipients**\n\n{', '.join(recipients)}")
 
-    extracted = report.get("extracted_entities") or {}
-    non_empty_entities = {
-        key: values for key, values in extracted.items() if isinstance(values, list) and values
-    }
-    if non_empty_entities:
-        entity_lines = [
-            f"- {key}: {', '.join(values)}" for key, values in non_empty_entities.items()
+@st.fragment
+def _render_community_feed(settings: Settings, workflow: IssueWorkflowService) -> None:
+    # Filters, row selection and per-issue forms rerun only this function, not the other tabs.
+    logger = get_logger(__name__)
+    st.subheader("Reviewing Logs")
+    try:
+        feed_data_version = _data_file_version(settings.activity_store_file)
+        issues = _load_feed_issues(
+            workflow,
+            limit=100,
+            data_version=feed_data_version,
+        )
+    except UserVisibleError as exc:
+        logger.warning("Failed to load activity feed", extra={"context": {"detail": exc.detail}})
+        st.error(exc.user_message)
+        issues = []
+    except Exception:  # noqa: BLE001
+        logger.exception("Unexpected activity feed failure")
+        st.error("Unexpected error while loading activity feed.")
+        issues = []
+
+    if not issues:
+        st.info(
+            "No entries yet. Submit from Quick Snap, Quick Voice, or Unit Notes to populate "
+            "this feed."
+        )
+    else:
+        category_options = _feed_category_options(issues, data_version=feed_data_version)
+        category_filter_options = ["All", "Maintenance View", *category_options]
+
+        filter_col_1, filter_col_2, filter_col_3 = st.columns([2, 1, 2], gap="small")
+        with filter_col_1:
+            category_filter = st.selectbox(
+                "Category / Department",
+                options=category_filter_options,
+                index=0,
+                key="feed_category_department_filter",
+            )
+        with filter_col_2:
+            source_filter = st.selectbox(
+                "Source",
+                options=_FEED_SOURCE_FILTER_OPTIONS,
+                index=0,
+                key="feed_source_filter_v2",
+            )
+        with filter_col_3:
+            sort_by = st.selectbox(
+                "Sort by",
+                options=_FEED_SORT_OPTIONS,
+                index=0,
+                key="feed_sort_by",
+            )
+
+        filtered_issues = [
+            issues[issue_idx]
+            for issue_idx in _filtered_issue_indices(
+                issues,
+                category_filter,
+                source_filter,
+                sort_by,
+                data_version=feed_data_version,
+            )
         ]
-        st.markdown("**Extracted Entities**\n\n" + "\n".join(entity_lines))
 
-    if report.get("photo_observation"):
-        st.markdown(f"**Photo Observation**\n\n{report['photo_observation']}")
+        export_bytes = _feed_export_bytes(
+            filtered_issues,
+            category_filter,
+            source_filter,
+            sort_by,
+            data_version=feed_data_version,
+        )
+        st.download_button(
+            label="Download Excel",
+            data=export_bytes,
+            file_name="propupkeep_reports.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            disabled=not filtered_issues,
+            key="download_filtered_issues_excel",
+        )
 
-    if report.get("needs_followup"):
-        questions = report.get("followup_questions", [])
-        if questions:
-            st.markdown("**Follow-up Questions Needed**\n\n" + "\n".join(f"- {q}" for q in questions))
+        detail_issues: list[IssueReport] = []
+        if not filtered_issues:
+            st.info("No feed items match the selected filters.")
         else:
-            st.markdown("**Follow-up Questions Needed**\n\n- Please provide additional details.")
+            # The visible page goes out as one Arrow-serialized table; full cards (status, comments)
+            # are only rendered for the rows the user selects. Rows are a prefix of the filtered feed,
+            # so selections stay valid as more are loaded.
+            row_limit = st.session_state.setdefault("feed_row_limit", _FEED_PAGE_SIZE)
+            visible_issues = filtered_issues[:row_limit]
+            feed_selection = st.dataframe(
+                _feed_table(
+                    visible_issues,
+                    settings.project_root,
+                    category_filter,
+                    source_filter,
+                    sort_by,
+                    row_limit,
+                    data_version=feed_data_version,
+                ),
+                use_container_width=True,
+                hide_index=True,
+                column_config={"photo": st.column_config.ImageColumn("Photo", width="small")},
+                on_select="rerun",
+                selection_mode="multi-row",
+                key="feed_table",
+            )
+            if len(filtered_issues) > row_limit:
+                st.caption(f"Showing {row_limit} of {len(filtered_issues)} entries.")
+                st.button("Load more", key="feed_load_more", on_click=_load_more_feed_rows)
+            detail_issues = [
+                visible_issues[row_idx]
+                for row_idx in feed_selection.selection.rows
+                if row_idx < len(visible_issues)
+            ]
+            if not detail_issues:
+                st.caption("Select rows to open details, update status, or add comments.")
+            elif len(detail_issues) > _MAX_FEED_DETAIL_CARDS:
+                # Selecting every row would otherwise render a full card and forms per issue.
+                st.caption(
+                    f"Showing details for the first {_MAX_FEED_DETAIL_CARDS} of "
+                    f"{len(detail_issues)} selected rows."
+                )
+                detail_issues = detail_issues[:_MAX_FEED_DETAIL_CARDS]
+
+        for issue_idx, issue in enumerate(detail_issues):
+            issue_id = str(issue.report_id or f"issue-{issue_idx}-{uuid4()}")
+            issue_text = issue.issue
+            urgency = issue.urgency.value
+            category = issue.category.value
+            action = issue.recommended_action
+            recipients = issue.recipients
+            source = _source_label(getattr(issue, "source", None))
+            timestamp = _format_ts(issue.created_at)
+            updated_timestamp = _format_ts(issue.updated_at)
+            location = (
+                f"{issue.property_name}"
+                f" · {issue.building}"
+                f" · Unit {issue.unit_number}"
+                f" · {issue.area or 'Unknown'}"
+            )
+            image_path = issue.image_path
+
+            with st.container():
+                thumb_col, detail_col = st.columns([1, 3], gap="small")
+                with thumb_col:
+                    if image_path:
+                        thumbnail = _feed_thumbnail(settings.project_root, str(image_path))
+                        if thumbnail:
+                            st.image(thumbnail, width=160)
+                        else:
+                            st.caption("Image not available")
+                    else:
+                        st.caption("No image")
+
+                with detail_col:
+                    # One markdown element per card instead of one per field; the status badge needs
+                    # raw HTML, so every user-supplied value is escaped.
+                    recipients_text = escape(", ".join(recipients)) if recipients else "Unassigned"
+                    detail_lines = [
+                        f"**Status:** {_status_badge_html(issue.status.value)}",
+                        f"**Issue:** {escape(issue_text)}",
+                        f"**Urgency:** {escape(urgency)}",
+                        f"**Category:** {escape(category)}",
+                        f"**Recommended Action:** {escape(action)}",
+                        f"**Recipients:** {recipients_text}",
+                        f"**Source:** {escape(source)}",
+                        f"**Timestamp:** {escape(timestamp)}",
+                        f"**Updated:** {escape(updated_timestamp)}",
+                        f"**Location:** {escape(location)}",
+                        f"**Comments:** {len(issue.comments)}",
+                    ]
+                    if issue.image_filename:
+                        detail_lines.append(f"**Image Filename:** {escape(issue.image_filename)}")
+                    st.markdown("\n\n".join(detail_lines), unsafe_allow_html=True)
+
+                    current_status = issue.status.value
+                    selected_status = st.selectbox(
+                        "Update Status",
+                        options=_STATUS_OPTIONS,
+                        index=_STATUS_OPTION_INDEX.get(current_status, 0),
+                        key=f"status_select_{issue_id}",
+                    )
+                    if selected_status != current_status:
+                        try:
+                            workflow.update_issue_status(issue_id, Status(selected_status))
+                        except UserVisibleError as exc:
+                            st.error(exc.user_message)
+                        except Exception:  # noqa: BLE001
+                            logger.exception("Failed to update issue status")
+                            st.error("Could not update issue status right now.")
+                        else:
+                            _load_issue_payloads.clear()
+                            _load_feed_issues.clear()
+                            st.success("Status updated.")
+                            st.rerun()
 
-    if report.get("image_filename"):
-        st.markdown(f"**Image Filename**\n\n{report['image_filename']}")
+                    # Collapsed by default; the form is only needed when someone is about to comment.
+                    with st.expander("Add internal comment", expanded=False):
+                        with st.form(key=f"comment_form_{issue_id}", clear_on_submit=True):
+                            author_col, role_col = st.columns([2, 2], gap="small")
+                            with author_col:
+                                comment_author = st.text_input(
+                                    "Author Name",
+                                    key=f"comment_author_{issue_id}",
+                                    placeholder="Name",
+                                )
+                            with role_col:
+                                comment_role = st.selectbox(
+                                    "Author Role",
+                                    options=_COMMENT_ROLE_OPTIONS,
+                                    key=f"comment_role_{issue_id}",
+                                )
+                            comment_message = st.text_area(
+                                "Comment Message",
+                                key=f"comment_message_{issue_id}",
+                                height=90,
+                                max_chars=800,
+                                placeholder="Add an internal coordination note...",
+                            )
+                            submitted = st.form_submit_button("Post Comment")
+                            if submitted:
+                                if not comment_message.strip():
+                                    st.warning("Please enter a comment message before posting.")
+                                else:
+                                    try:
+                                        workflow.add_issue_comment(
+                                            issue_id=issue_id,
+                                            author_name=comment_author,
+                                            author_role=comment_role,
+                                            message=comment_message,
+                                        )
+                                    except UserVisibleError as exc:
+                                        st.error(exc.user_message)
+                                    except Exception:  # noqa: BLE001
+                                        logger.exception("Failed to post issue comment")
+                                        st.error("Could not post comment right now.")
+                                    else:
+                                        _load_issue_payloads.clear()
+                                        _load_feed_issues.clear()
+                                        st.success("Comment posted.")
+                                        st.rerun()
+
+                    if issue.comments:
+                        ordered_comments = sorted(
+                            issue.comments,
+                            key=lambda comment: _date_sort_value(comment.created_at),
+                        )
+                        # The whole history is one element rather than one per comment.
+                        comment_lines = [
+                            (
+                                f"- **{comment.author_name}** ({comment.author_role}) "
+                                f"@ {_format_ts(comment.created_at)}  \n"
+                                f"  {comment.message}"
+                            )
+                            for comment in ordered_comments
+                        ]
+                        st.markdown("\n".join(["**Comment History**", "", *comment_lines]))
+            st.divider()
 
 
 def run_app() -> None:
@@ -299,47 +828,26 @@ def run_app() -> None:
 
     with st.sidebar:
         st.header("Property Selector")
+        # Plain widgets rather than a form: a form only reports its last applied values, so a report could be
+        # filed under a location the user had already changed. Selectbox reruns are cheap.
         property_name = st.selectbox(
             "Property",
-            options=[
-                "Oak Ridge Apartments",
-                "Maple Court Homes",
-                "Riverstone Commons",
-            ],
+            options=_PROPERTY_OPTIONS,
             index=0,
         )
         building = st.selectbox(
             "Building",
-            options=["Building A", "Building B", "Building C", "Townhomes"],
+            options=_BUILDING_OPTIONS,
             index=0,
         )
         unit_number = st.selectbox(
             "Unit Number",
-            options=[
-                "101",
-                "102",
-                "103",
-                "104",
-                "201",
-                "202",
-                "203",
-                "204",
-            ],
+            options=_UNIT_OPTIONS,
             index=0,
         )
         area_choice = st.selectbox(
             "Area",
-            options=[
-                "Unknown",
-                "Kitchen",
-                "Bathroom",
-                "Living Room",
-                "Bedroom",
-                "Laundry",
-                "Exterior",
-                "Hallway",
-                "Other",
-            ],
+            options=_AREA_OPTIONS,
             index=0,
         )
         custom_area = ""
@@ -350,13 +858,21 @@ def run_app() -> None:
         st.caption(f"Working on {property_name} · {building} · Unit {unit_number}")
         st.caption(f"Max upload size: {settings.max_upload_mb} MB")
 
+    location = (property_name, building, unit_number, None if area == "Unknown" else area)
+
     def _build_metadata() -> IssueMetadata:
-        return IssueMetadata(
-            property_name=property_name,
-            building=building,
-            unit_number=unit_number,
-            area=None if area == "Unknown" else area,
+        # Reuse the validated model across reruns and tabs while the selected location is unchanged.
+        cached = st.session_state.get("metadata")
+        if cached is not None and cached[0] == location:
+            return cached[1]
+        metadata = IssueMetadata(
+            property_name=location[0],
+            building=location[1],
+            unit_number=location[2],
+            area=location[3],
         )
+        st.session_state["metadata"] = (location, metadata)
+        return metadata
 
     quick_snap_tab, quick_voice_tab, unit_notes_tab, community_feed_tab, operational_pulse_tab = st.tabs(
         ["Quick Snap", "Quick Voice", "Unit Notes", "Community Feed", "Operational Pulse"]
@@ -375,10 +891,21 @@ def run_app() -> None:
             key="quick_snap_note",
         )
 
-        oversized_upload = bool(photo and photo.size > settings.max_upload_bytes)
-        invalid_mime = bool(
-            photo and (photo.type or "").lower() not in {"image/png", "image/jpeg", "image/jpg"}
-        )
+        oversized_upload = False
+        sniffed_mime = None
+        if photo:
+            # Validate each upload once; edits to the note rerun the script with the same file_id.
+            photo_key = (photo.file_id, photo.size)
+            cached_check = st.session_state.get("quick_snap_photo_check")
+            if cached_check is not None and cached_check[0] == photo_key:
+                oversized_upload, sniffed_mime = cached_check[1]
+            else:
+                oversized_upload = photo.size > settings.max_upload_bytes
+                # photo.type is whatever the browser claims; check the file's own header instead.
+                sniffed_mime = sniff_image_mime(photo.read(IMAGE_SIGNATURE_BYTES))
+                photo.seek(0)
+                st.session_state["quick_snap_photo_check"] = (photo_key, (oversized_upload, sniffed_mime))
+        invalid_mime = bool(photo and not sniffed_mime)
         if oversized_upload:
             st.error(
                 f"Photo is larger than {settings.max_upload_mb} MB. "
@@ -401,18 +928,16 @@ def run_app() -> None:
             elif invalid_mime:
                 st.warning("Unsupported image type. Please upload PNG or JPEG.")
             else:
-                image_bytes = photo.getvalue() if photo else None
                 image_filename = photo.name if photo else None
-                image_mime = (photo.type or "").lower() if photo else None
                 with st.spinner("Formatting report..."):
                     try:
                         report = workflow.submit_issue(
                             source=IssueSource.QUICK_SNAP,
                             note_text=quick_note_text,
                             metadata=_build_metadata(),
-                            image_bytes=image_bytes,
+                            image_stream=photo,
                             image_filename=image_filename,
-                            image_mime=image_mime,
+                            image_mime=sniffed_mime,
                         )
                     except UserVisibleError as exc:
                         logger.warning(
@@ -424,12 +949,13 @@ def run_app() -> None:
                         logger.exception("Unexpected photo submission failure")
                         st.error("Unexpected error while formatting photo submission. Please retry.")
                     else:
-                        st.session_state["last_photo_report"] = report.model_dump(mode="json")
+                        st.session_state["last_photo_report"] = _structured_report_markdown(report)
                         _load_issue_payloads.clear()
+                        _load_feed_issues.clear()
                         st.success("Structured issue report generated from quick snap.")
 
         if st.session_state.get("last_photo_report"):
-            _render_structured_report(st.session_state["last_photo_report"])
+            st.markdown(st.session_state["last_photo_report"])
 
     with quick_voice_tab:
         _ensure_voice_state()
@@ -548,8 +1074,12 @@ def run_app() -> None:
                             logger.exception("Unexpected voice formatting failure")
                             st.error("Unexpected error while formatting voice note. Please retry.")
                         else:
-                            st.session_state["voice_formatted_output"] = report.model_dump(mode="json")
+                            st.session_state["voice_formatted_output"] = _structured_report_markdown(
+                                report,
+                                heading="Structured Work Item",
+                            )
                             _load_issue_payloads.clear()
+                            _load_feed_issues.clear()
                             st.success("Structured work item generated from voice note.")
         with clear_col:
             if st.button("Re-record", key="voice_rerecord"):
@@ -557,10 +1087,7 @@ def run_app() -> None:
                 st.rerun()
 
         if st.session_state.get("voice_formatted_output"):
-            _render_structured_report(
-                st.session_state["voice_formatted_output"],
-                heading="Structured Work Item",
-            )
+            st.markdown(st.session_state["voice_formatted_output"])
 
     with unit_notes_tab:
         st.subheader("Unit Notes")
@@ -571,6 +1098,9 @@ def run_app() -> None:
                 "possible gasket issue, floor wet near sink."
             ),
             key="unit_note_text",
+            # Opt-in: each blur would otherwise send a billed request, even for drafts never submitted.
+            on_change=_prefetch_unit_note if settings.enable_ai_prefetch else None,
+            args=(workflow, _build_metadata),
         )
 
         if st.button("Format for Team", key="format_for_team"):
@@ -594,280 +1124,24 @@ def run_app() -> None:
                         "Please try again in a moment."
                     )
                 else:
-                    st.session_state["last_note_report"] = report.model_dump(mode="json")
+                    st.session_state["last_note_report"] = _structured_report_markdown(report)
                     _load_issue_payloads.clear()
+                    _load_feed_issues.clear()
                     st.success("Professional issue report generated.")
 
         if st.session_state.get("last_note_report"):
-            _render_structured_report(st.session_state["last_note_report"])
+            st.markdown(st.session_state["last_note_report"])
 
     with community_feed_tab:
-        st.subheader("Reviewing Logs")
-        try:
-            issue_payloads = _load_issue_payloads(workflow, limit=100)
-            issues = _hydrate_issues(issue_payloads)
-        except UserVisibleError as exc:
-            logger.warning("Failed to load activity feed", extra={"context": {"detail": exc.detail}})
-            st.error(exc.user_message)
-            issues = []
-        except Exception:  # noqa: BLE001
-            logger.exception("Unexpected activity feed failure")
-            st.error("Unexpected error while loading activity feed.")
-            issues = []
-
-        if not issues:
-            st.info(
-                "No entries yet. Submit from Quick Snap, Quick Voice, or Unit Notes to populate "
-                "this feed."
-            )
-        else:
-            category_options = sorted(
-                {
-                    str(issue.category.value).strip()
-                    for issue in issues
-                    if str(issue.category.value).strip()
-                }
-            )
-            category_filter_options = ["All", "Maintenance View", *category_options]
-            source_filter_options = ["All", "Quick Snap", "Unit Notes", "Quick Voice"]
-            source_filter_to_key = {
-                "Quick Snap": IssueSource.QUICK_SNAP.value,
-                "Unit Notes": IssueSource.UNIT_NOTES.value,
-                "Quick Voice": IssueSource.QUICK_VOICE.value,
-            }
-
-            filter_col_1, filter_col_2, filter_col_3 = st.columns([2, 1, 2], gap="small")
-            with filter_col_1:
-                category_filter = st.selectbox(
-                    "Category / Department",
-                    options=category_filter_options,
-                    index=0,
-                    key="feed_category_department_filter",
-                )
-            with filter_col_2:
-                source_filter = st.selectbox(
-                    "Source",
-                    options=source_filter_options,
-                    index=0,
-                    key="feed_source_filter_v2",
-                )
-            with filter_col_3:
-                sort_by = st.selectbox(
-                    "Sort by",
-                    options=[
-                        "Date (Newest)",
-                        "Date (Oldest)",
-                        "Urgency (High->Low)",
-                        "Urgency (Low->High)",
-                    ],
-                    index=0,
-                    key="feed_sort_by",
-                )
-
-            filtered_issues = issues
-            if category_filter == "Maintenance View":
-                filtered_issues = [
-                    issue
-                    for issue in filtered_issues
-                    if _is_maintenance_routed(issue.recipients)
-                ]
-            elif category_filter != "All":
-                filtered_issues = [
-                    issue
-                    for issue in filtered_issues
-                    if str(issue.category.value).strip() == category_filter
-                ]
-
-            if source_filter != "All":
-                selected_source = source_filter_to_key.get(source_filter)
-                if selected_source:
-                    filtered_issues = [
-                        issue
-                        for issue in filtered_issues
-                        if _normalize_source_value(getattr(issue, "source", None)) == selected_source
-                    ]
-
-            if sort_by == "Date (Newest)":
-                filtered_issues = sorted(
-                    filtered_issues,
-                    key=lambda issue: _date_sort_value(issue.created_at),
-                    reverse=True,
-                )
-            elif sort_by == "Date (Oldest)":
-                filtered_issues = sorted(
-                    filtered_issues,
-                    key=lambda issue: _date_sort_value(issue.created_at),
-                )
-            elif sort_by == "Urgency (High->Low)":
-                filtered_issues = sorted(
-                    filtered_issues,
-                    key=lambda issue: (
-                        _urgency_rank(issue.urgency.value),
-                        _date_sort_value(issue.created_at),
-                    ),
-                    reverse=True,
-                )
-            else:  # Urgency (Low->High)
-                filtered_issues = sorted(
-                    filtered_issues,
-                    key=lambda issue: (
-                        _urgency_rank(issue.urgency.value),
-                        _date_sort_value(issue.created_at),
-                    ),
-                )
-
-            export_bytes = export_issues_to_excel_bytes(filtered_issues)
-            st.download_button(
-                label="Download Excel",
-                data=export_bytes,
-                file_name="propupkeep_reports.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                disabled=not filtered_issues,
-                key="download_filtered_issues_excel",
-            )
-
-            if not filtered_issues:
-                st.info("No feed items match the selected filters.")
-
-            for issue_idx, issue in enumerate(filtered_issues):
-                issue_id = str(issue.report_id or f"issue-{issue_idx}-{uuid4()}")
-                issue_text = issue.issue
-                urgency = issue.urgency.value
-                category = issue.category.value
-                action = issue.recommended_action
-                recipients = issue.recipients
-                source = _source_label(getattr(issue, "source", None))
-                timestamp = _format_ts(issue.created_at)
-                updated_timestamp = _format_ts(issue.updated_at)
-                location = (
-                    f"{issue.property_name}"
-                    f" · {issue.building}"
-                    f" · Unit {issue.unit_number}"
-                    f" · {issue.area or 'Unknown'}"
-                )
-                image_path = issue.image_path
-
-                with st.container():
-                    thumb_col, detail_col = st.columns([1, 3], gap="small")
-                    with thumb_col:
-                        if image_path:
-                            resolved_path = _resolve_image_path(settings.project_root, str(image_path))
-                            if resolved_path and resolved_path.exists():
-                                st.image(str(resolved_path), width=160)
-                            else:
-                                st.caption("Image not available")
-                        else:
-                            st.caption("No image")
-
-                    with detail_col:
-                        st.markdown(
-                            f"**Status:** {_status_badge_html(issue.status.value)}",
-                            unsafe_allow_html=True,
-                        )
-                        st.markdown(f"**Issue:** {issue_text}")
-                        st.markdown(f"**Urgency:** {urgency}")
-                        st.markdown(f"**Category:** {category}")
-                        st.markdown(f"**Recommended Action:** {action}")
-                        st.markdown(
-                            f"**Recipients:** {', '.join(recipients) if recipients else 'Unassigned'}"
-                        )
-                        st.markdown(f"**Source:** {source}")
-                        st.markdown(f"**Timestamp:** {timestamp}")
-                        st.markdown(f"**Updated:** {updated_timestamp}")
-                        st.markdown(f"**Location:** {location}")
-                        st.markdown(f"**Comments:** {len(issue.comments)}")
-                        if issue.image_filename:
-                            st.markdown(f"**Image Filename:** {issue.image_filename}")
-
-                        status_options = [status.value for status in Status]
-                        current_status = issue.status.value
-                        status_index = (
-                            status_options.index(current_status)
-                            if current_status in status_options
-                            else 0
-                        )
-                        selected_status = st.selectbox(
-                            "Update Status",
-                            options=status_options,
-                            index=status_index,
-                            key=f"status_select_{issue_id}",
-                        )
-                        if selected_status != current_status:
-                            try:
-                                workflow.update_issue_status(issue_id, Status(selected_status))
-                            except UserVisibleError as exc:
-                                st.error(exc.user_message)
-                            except Exception:  # noqa: BLE001
-                                logger.exception("Failed to update issue status")
-                                st.error("Could not update issue status right now.")
-                            else:
-                                _load_issue_payloads.clear()
-                                st.success("Status updated.")
-                                st.rerun()
-
-                        st.caption("Internal team comments")
-                        with st.form(key=f"comment_form_{issue_id}", clear_on_submit=True):
-                            author_col, role_col = st.columns([2, 2], gap="small")
-                            with author_col:
-                                comment_author = st.text_input(
-                                    "Author Name",
-                                    key=f"comment_author_{issue_id}",
-                                    placeholder="Name",
-                                )
-                            with role_col:
-                                comment_role = st.selectbox(
-                                    "Author Role",
-                                    options=list(COMMENT_AUTHOR_ROLES),
-                                    key=f"comment_role_{issue_id}",
-                                )
-                            comment_message = st.text_area(
-                                "Comment Message",
-                                key=f"comment_message_{issue_id}",
-                                height=90,
-                                max_chars=800,
-                                placeholder="Add an internal coordination note...",
-                            )
-                            submitted = st.form_submit_button("Post Comment")
-                            if submitted:
-                                if not comment_message.strip():
-                                    st.warning("Please enter a comment message before posting.")
-                                else:
-                                    try:
-                                        workflow.add_issue_comment(
-                                            issue_id=issue_id,
-                                            author_name=comment_author,
-                                            author_role=comment_role,
-                                            message=comment_message,
-                                        )
-                                    except UserVisibleError as exc:
-                                        st.error(exc.user_message)
-                                    except Exception:  # noqa: BLE001
-                                        logger.exception("Failed to post issue comment")
-                                        st.error("Could not post comment right now.")
-                                    else:
-                                        _load_issue_payloads.clear()
-                                        st.success("Comment posted.")
-                                        st.rerun()
-
-                        if issue.comments:
-                            st.markdown("**Comment History**")
-                            ordered_comments = sorted(
-                                issue.comments,
-                                key=lambda comment: _date_sort_value(comment.created_at),
-                            )
-                            for comment in ordered_comments:
-                                st.markdown(
-                                    (
-                                        f"- **{comment.author_name}** ({comment.author_role}) "
-                                        f"@ {_format_ts(comment.created_at)}  \n"
-                                        f"  {comment.message}"
-                                    )
-                                )
-                st.divider()
+        _render_community_feed(settings, workflow)
 
     with operational_pulse_tab:
         try:
-            pulse_records = _load_issue_payloads(workflow, limit=500)
+            pulse_records = _load_issue_payloads(
+                workflow,
+                limit=500,
+                data_version=_data_file_version(settings.activity_store_file),
+            )
         except UserVisibleError as exc:
             logger.warning(
                 "Failed to load operational pulse records",